@@ -1,7 +1,28 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from .models import TokenUsageLog
-from django.db.models import Sum
+from django.db.models import Count, Sum
+from django.urls import reverse
 from django.utils.html import format_html
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _session_change_url_template():
+    """Resolve the session change URL once and return it as a format string"""
+    url = reverse('admin:research_researchsession_change', args=['__id__'])
+    return url.replace('__id__', '{}')
+
+
+class TokenUsageLogChangeList(ChangeList):
+    """Changelist that only loads the columns shown in list_display"""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.only(
+            'id', 'timestamp', 'endpoint', 'model', 'total_tokens',
+            'cost_estimate', 'session', 'session__title'
+        )
 
 
 @admin.register(TokenUsageLog)
@@ -15,8 +36,9 @@ class TokenUsageLogAdmin(admin.ModelAdmin):
         'session_link'
     )
     list_filter = ('endpoint', 'model', 'timestamp')
+    list_select_related = ('session',)
     search_fields = ('session__title',)
-    readonly_fields = ('timestamp',)
+    readonly_fields = ('timestamp', 'total_tokens')
     date_hierarchy = 'timestamp'
 
     fieldsets = (
@@ -32,15 +54,19 @@ class TokenUsageLogAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return TokenUsageLogChangeList
+
     def cost_display(self, obj):
+        # Rounded here rather than with a SQL Cast: SQLite ignores the cast
+        # scale, so the Python format would be needed anyway
         return f"${obj.cost_estimate:.4f}"
     cost_display.short_description = 'Cost'
+    cost_display.admin_order_field = 'cost_estimate'
 
     def session_link(self, obj):
-        if obj.session:
-            from django.urls import reverse
-            from django.utils.html import format_html
-            url = reverse('admin:research_researchsession_change', args=[obj.session.id])
+        if obj.session_id:
+            url = _session_change_url_template().format(obj.session_id)
             return format_html('<a href="{}">{}</a>', url, obj.session.title)
         return '-'
     session_link.short_description = 'Session'
@@ -51,9 +77,22 @@ class TokenUsageLogAdmin(admin.ModelAdmin):
 
         try:
             qs = response.context_data['cl'].queryset
+
+            # One aggregate query for all totals, one grouped query for the
+            # per-model breakdown (no Python-side loops over rows)
             summary = qs.aggregate(
                 total_tokens=Sum('total_tokens'),
-                total_cost=Sum('cost_estimate')
+                total_cost=Sum('cost_estimate'),
+                total_prompt_tokens=Sum('prompt_tokens'),
+                total_completion_tokens=Sum('completion_tokens'),
+                total_requests=Count('id'),
+            )
+            summary['by_model'] = list(
+                qs.order_by().values('model').annotate(
+                    total_tokens=Sum('total_tokens'),
+                    total_cost=Sum('cost_estimate'),
+                    total_requests=Count('id'),
+                ).order_by('-total_cost')
             )
 
             response.context_data['summary'] = summary
@@ -3,6 +3,9 @@ Claude Client Factory - Factory function to get the appropriate client
 """
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from functools import lru_cache
 from .client_interface import ClaudeClient
 from .live_client import LiveClaudeClient
 from .stub_client import StubClaudeClient
@@ -11,10 +14,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_claude_client() -> ClaudeClient:
     """
     Factory function to get the appropriate Claude client.
 
+    The choice only depends on settings, so the client is built once per
+    process and reused by every view.
+
     Returns LiveClaudeClient in production when API key is configured,
     StubClaudeClient for development/testing.
 
@@ -43,3 +50,10 @@ def get_claude_client() -> ClaudeClient:
     # Use live client
     logger.info("Using live Anthropic API client")
     return LiveClaudeClient()
+
+
+@receiver(setting_changed)
+def _reset_claude_client(setting, **kwargs):
+    """Drop the cached client when the settings it depends on change (tests)"""
+    if setting in ('USE_STUB_AI', 'ANTHROPIC_API_KEY'):
+        get_claude_client.cache_clear()
@@ -8,20 +8,101 @@ from .client_interface import ClaudeClient, ClaudeResponse, TokenUsage
 from typing import List, Dict
 import json
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Per-request timeout and retries for the Anthropic client. The worst case,
+# (API_MAX_RETRIES + 1) * API_TIMEOUT_SECONDS, must stay below
+# research.tasks.GENERATION_TIMEOUT_SECONDS so a running background
+# generation always finishes before it could be treated as lost
+API_TIMEOUT_SECONDS = 120
+API_MAX_RETRIES = 1
+
+
+# Prompt templates are built once at import; the builders only fill in the
+# per-request values via str.format
+_VALIDATION_TEMPLATE = """Is this question related to investing, finance, or retirement planning?
+
+Question: "{question}"
+
+Respond with ONLY a JSON object in this format:
+{{"valid": true/false}}"""
+
+_CLARIFICATION_TEMPLATE = """You are an investment research assistant. A user has asked:
+
+"{question}"
+
+Generate 2-3 clarifying questions to better understand their context. Focus on:
+- Risk tolerance
+- Investment timeline
+- Current portfolio allocation
+- Specific concerns or goals
+
+Return ONLY a JSON array of strings (the questions), no other text.
+
+Example: ["What is your risk tolerance?", "What's your investment timeline?", "What percentage of your portfolio is in stocks?"]
+"""
+
+_RESPONSE_TEMPLATE = """You are an investment research assistant helping a user with their question.
+
+Original Question: {question}
+
+User Context:
+{context}
+
+Provide a thoughtful response in the following JSON format:
+{{
+  "summary": "2-3 sentence summary recommendation",
+  "analysis": "Detailed markdown-formatted analysis with key considerations (use ## headers, bullet points, etc.)",
+  "links": [
+    {{"title": "Link title", "url": "https://...", "description": "Brief description"}},
+    ...
+  ]
+}}
+
+Guidelines:
+- Be balanced and educational
+- Never provide definitive "buy" or "sell" advice
+- Include 3-5 high-quality, relevant links to reputable sources (Investopedia, Fidelity, Vanguard, SEC, etc.)
+- Use markdown formatting in the analysis field for readability
+- Consider the user's risk tolerance, timeline, and goals from the context
+"""
+
 
 class LiveClaudeClient(ClaudeClient):
     """
     Production implementation using Anthropic API.
+
+    The underlying anthropic.Anthropic client is shared across instances so
+    its HTTP connection pool (and TLS sessions) survive between requests.
     """
 
+    _shared_client = None
+    _shared_client_lock = threading.Lock()
+
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.client = self._get_shared_client()
         self.default_model = "claude-3-5-sonnet-20241022"
         self.fast_model = "claude-3-5-haiku-20241022"
 
+    @classmethod
+    def _get_shared_client(cls) -> anthropic.Anthropic:
+        """Return the process-wide Anthropic client, creating it on first use"""
+        api_key = settings.ANTHROPIC_API_KEY
+        client = cls._shared_client
+        if client is None or client.api_key != api_key:
+            with cls._shared_client_lock:
+                client = cls._shared_client
+                if client is None or client.api_key != api_key:
+                    client = anthropic.Anthropic(
+                        api_key=api_key,
+                        timeout=API_TIMEOUT_SECONDS,
+                        max_retries=API_MAX_RETRIES,
+                    )
+                    cls._shared_client = client
+        return client
+
     def generate_clarifications(self, question: str) -> ClaudeResponse:
         """Generate clarifying questions using Haiku (fast, cheap)"""
         try:
@@ -111,12 +192,7 @@ class LiveClaudeClient(ClaudeClient):
     def validate_question(self, question: str) -> ClaudeResponse:
         """Quick validation using Haiku"""
         try:
-            prompt = f"""Is this question related to investing, finance, or retirement planning?
-
-Question: "{question}"
-
-Respond with ONLY a JSON object in this format:
-{{"valid": true/false}}"""
+            prompt = _VALIDATION_TEMPLATE.format(question=question)
 
             logger.debug(f"Validating question: {question[:100]}...")
 
@@ -197,20 +273,7 @@ Respond with ONLY a JSON object in this format:
 
     def _build_clarification_prompt(self, question: str) -> str:
         """Build prompt for clarification generation"""
-        return f"""You are an investment research assistant. A user has asked:
-
-"{question}"
-
-Generate 2-3 clarifying questions to better understand their context. Focus on:
-- Risk tolerance
-- Investment timeline
-- Current portfolio allocation
-- Specific concerns or goals
-
-Return ONLY a JSON array of strings (the questions), no other text.
-
-Example: ["What is your risk tolerance?", "What's your investment timeline?", "What percentage of your portfolio is in stocks?"]
-"""
+        return _CLARIFICATION_TEMPLATE.format(question=question)
 
     def _build_response_prompt(
         self,
@@ -223,27 +286,4 @@ Example: ["What is your risk tolerance?", "What's your investment timeline?", "W
             for item in clarifications
         ])
 
-        return f"""You are an investment research assistant helping a user with their question.
-
-Original Question: {question}
-
-User Context:
-{context}
-
-Provide a thoughtful response in the following JSON format:
-{{
-  "summary": "2-3 sentence summary recommendation",
-  "analysis": "Detailed markdown-formatted analysis with key considerations (use ## headers, bullet points, etc.)",
-  "links": [
-    {{"title": "Link title", "url": "https://...", "description": "Brief description"}},
-    ...
-  ]
-}}
-
-Guidelines:
-- Be balanced and educational
-- Never provide definitive "buy" or "sell" advice
-- Include 3-5 high-quality, relevant links to reputable sources (Investopedia, Fidelity, Vanguard, SEC, etc.)
-- Use markdown formatting in the analysis field for readability
-- Consider the user's risk tolerance, timeline, and goals from the context
-"""
+        return _RESPONSE_TEMPLATE.format(question=question, context=context)
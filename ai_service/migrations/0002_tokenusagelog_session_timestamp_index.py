@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-15 15:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_service", "0001_initial"),
+        ("research", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tokenusagelog",
+            index=models.Index(
+                fields=["session", "-timestamp"], name="ai_service__session_b18d02_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.14 on 2026-10-15 15:32
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_service", "0002_tokenusagelog_session_timestamp_index"),
+    ]
+
+    operations = [
+        # A regular column cannot be altered into a generated one, so it is
+        # dropped and re-added; the database recomputes existing values
+        migrations.RemoveField(
+            model_name="tokenusagelog",
+            name="total_tokens",
+        ),
+        migrations.AddField(
+            model_name="tokenusagelog",
+            name="total_tokens",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("prompt_tokens"), "+", models.F("completion_tokens")
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+    ]
@@ -15,7 +15,12 @@ class TokenUsageLog(models.Model):
     model = models.CharField(max_length=50)  # e.g., 'claude-3-5-sonnet-20241022'
     prompt_tokens = models.IntegerField()
     completion_tokens = models.IntegerField()
-    total_tokens = models.IntegerField()
+    # Always prompt + completion, so let the database maintain it
+    total_tokens = models.GeneratedField(
+        expression=models.F('prompt_tokens') + models.F('completion_tokens'),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
     cost_estimate = models.DecimalField(max_digits=10, decimal_places=6)
     session = models.ForeignKey(
         'research.ResearchSession',
@@ -32,6 +37,7 @@ class TokenUsageLog(models.Model):
             models.Index(fields=['-timestamp']),
             models.Index(fields=['endpoint']),
             models.Index(fields=['model']),
+            models.Index(fields=['session', '-timestamp']),
         ]
 
     def __str__(self):
@@ -2,25 +2,50 @@
 Utility functions for AI service
 """
 
-from decimal import Decimal
+from decimal import Context, Decimal
 from .client_interface import TokenUsage
 
 
 # Claude pricing (as of October 2024)
 # https://www.anthropic.com/pricing
+# Stored as (input, output) cost per token so calculate_cost avoids per-call division
 PRICING = {
-    'claude-3-5-sonnet-20241022': {
-        'input': Decimal('0.003') / 1000,  # $3 per million tokens
-        'output': Decimal('0.015') / 1000,  # $15 per million tokens
-    },
-    'claude-3-5-haiku-20241022': {
-        'input': Decimal('0.001') / 1000,  # $1 per million tokens
-        'output': Decimal('0.005') / 1000,  # $5 per million tokens
-    },
-    'stub': {
-        'input': Decimal('0'),
-        'output': Decimal('0'),
-    }
+    'claude-3-5-sonnet-20241022': (
+        Decimal('0.000003'),  # $3 per million input tokens
+        Decimal('0.000015'),  # $15 per million output tokens
+    ),
+    'claude-3-5-haiku-20241022': (
+        Decimal('0.000001'),  # $1 per million input tokens
+        Decimal('0.000005'),  # $5 per million output tokens
+    ),
+    'stub': (Decimal('0'), Decimal('0')),
+}
+
+DEFAULT_MODEL = 'claude-3-5-sonnet-20241022'
+
+
+# Costs have at most 6 fractional digits and stay well under $1M, so 12
+# significant digits is exact while keeping Decimal arithmetic cheap
+_COST_CONTEXT = Context(prec=12)
+
+
+def _make_cost_func(input_price: Decimal, output_price: Decimal):
+    """Build a cost function with the model's per-token prices bound in"""
+    multiply = _COST_CONTEXT.multiply
+    add = _COST_CONTEXT.add
+
+    def cost(prompt_tokens: int, completion_tokens: int) -> Decimal:
+        return add(
+            multiply(input_price, prompt_tokens),
+            multiply(output_price, completion_tokens)
+        )
+    return cost
+
+
+# One specialized cost function per model, built once at import
+_COST_FUNCS = {
+    model: _make_cost_func(input_price, output_price)
+    for model, (input_price, output_price) in PRICING.items()
 }
 
 
@@ -34,15 +59,9 @@ def calculate_cost(token_usage: TokenUsage) -> Decimal:
     Returns:
         Decimal cost in USD
     """
-    model = token_usage.model
-
     # Get pricing for this model, default to Sonnet if unknown
-    pricing = PRICING.get(model, PRICING['claude-3-5-sonnet-20241022'])
-
-    input_cost = Decimal(token_usage.prompt_tokens) * pricing['input']
-    output_cost = Decimal(token_usage.completion_tokens) * pricing['output']
-
-    return input_cost + output_cost
+    cost = _COST_FUNCS.get(token_usage.model) or _COST_FUNCS[DEFAULT_MODEL]
+    return cost(token_usage.prompt_tokens, token_usage.completion_tokens)
 
 
 def format_cost(cost: Decimal) -> str:
@@ -125,14 +125,18 @@ if REDIS_URL:
         }
     }
 else:
-    # Development: Use file-based cache (no Redis needed)
+    # Development: Use file-based cache (no Redis needed). Entries persist
+    # across processes, so repeated management command runs (e.g.
+    # scan_premarket_movers) reuse cached API responses within their TTL.
     CACHES = {
         'default': {
             'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
-            'LOCATION': '/tmp/picker_django_cache',
+            'LOCATION': config('CACHE_DIR', default='/tmp/picker_django_cache'),
             'TIMEOUT': int(config('CACHE_DEFAULT_TIMEOUT', default=300)),
             'OPTIONS': {
-                'MAX_ENTRIES': 1000,
+                # Room for a full universe scan (quotes + news per symbol)
+                # without culling the shared FMP lists
+                'MAX_ENTRIES': int(config('CACHE_MAX_ENTRIES', default=5000)),
             }
         }
     }
@@ -198,6 +202,10 @@ LOGOUT_REDIRECT_URL = 'core:login'
 USE_STUB_AI = config('USE_STUB_AI', default=True, cast=bool)
 ANTHROPIC_API_KEY = config('ANTHROPIC_API_KEY', default='')
 
+# Threads generating research responses in the background (0 = inline in the
+# request, the development default)
+AI_BACKGROUND_WORKERS = config('AI_BACKGROUND_WORKERS', default=0 if DEBUG else 4, cast=int)
+
 # Market Data API Configuration
 FINNHUB_API_KEY = config('FINNHUB_API_KEY', default='')
 FMP_API_KEY = config('FMP_API_KEY', default='')  # Financial Modeling Prep
@@ -1,5 +1,5 @@
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, logout, authenticate
+from django.contrib.auth import login, logout
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib import messages
 
@@ -12,17 +12,14 @@ def user_login(request):
     if request.method == 'POST':
         form = AuthenticationForm(request, data=request.POST)
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(username=username, password=password)
-            if user is not None:
-                login(request, user)
-                messages.success(request, f'Welcome back, {username}!')
-                # Redirect to next parameter or home
-                next_url = request.GET.get('next', 'research:home')
-                return redirect(next_url)
-            else:
-                messages.error(request, 'Invalid username or password.')
+            # is_valid() already authenticated the user; reuse that result
+            # rather than running the password hasher a second time
+            user = form.get_user()
+            login(request, user)
+            messages.success(request, f'Welcome back, {user.get_username()}!')
+            # Redirect to next parameter or home
+            next_url = request.GET.get('next', 'research:home')
+            return redirect(next_url)
         else:
             messages.error(request, 'Invalid username or password.')
     else:
@@ -48,8 +45,11 @@ def user_register(request):
         if form.is_valid():
             user = form.save()
             username = form.cleaned_data.get('username')
-            messages.success(request, f'Account created for {username}! Please log in.')
-            return redirect('core:login')
+            # Log the new user in directly instead of sending them back
+            # through the login form (saves a round trip and a password hash)
+            login(request, user)
+            messages.success(request, f'Account created for {username}! Welcome to Picker.')
+            return redirect('research:home')
         else:
             messages.error(request, 'Please correct the errors below.')
     else:
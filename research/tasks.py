@@ -0,0 +1,238 @@
+"""
+Background tasks for the research flow.
+
+Generating a research response is a multi-second AI API call. Rather than
+pinning a web worker for the duration, submit_clarifications hands it to a
+small in-process thread pool and the session page polls until the response
+lands. The pool is a stand-in for a real task queue; the task functions take
+only ids and plain data so they can move to one unchanged.
+
+Set AI_BACKGROUND_WORKERS=0 to run generation inline in the request.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from .models import ResearchSession, ResearchResponse, UserResponse
+from ai_service.client_factory import get_claude_client
+from ai_service.models import TokenUsageLog
+from ai_service.utils import calculate_cost
+import logging
+import markdown
+import orjson
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# How long a background failure is kept for the session page to report
+GENERATION_ERROR_TTL = 3600
+
+# A generation that has not started this long after the answers were
+# submitted is treated as lost (worker restarted or killed) and reported as
+# failed. Started jobs hold a lease of the same length, which outlasts the AI
+# client's worst case (see ai_service.live_client.API_TIMEOUT_SECONDS)
+GENERATION_TIMEOUT_SECONDS = 300
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Markdown instances are expensive to build (extension registration) but
+# not thread-safe, so each worker thread keeps one and resets it per use
+_markdown_local = threading.local()
+
+
+@lru_cache(maxsize=512)
+def _render_markdown(text):
+    """
+    Convert markdown text to HTML using this thread's Markdown instance.
+
+    Conversion is a pure function of the text, so identical analyses (e.g.
+    resubmitted or stub responses) are served from a bounded LRU cache.
+    The rendered HTML is also persisted on ResearchResponse, so session
+    pages never re-render.
+    """
+    md = getattr(_markdown_local, 'md', None)
+    if md is None:
+        md = _markdown_local.md = markdown.Markdown(extensions=['extra', 'nl2br'])
+    return md.reset().convert(text)
+
+
+def generation_error_key(session_id):
+    """Cache key holding the error message of a failed background generation."""
+    return f"research:generation_error:{session_id}"
+
+
+def generation_job_key(session_id):
+    """Cache key holding the token of the session's queued generation job."""
+    return f"research:generation_job:{session_id}"
+
+
+def generation_started_key(session_id):
+    """Cache key marking that the session's generation job is running."""
+    return f"research:generation_started:{session_id}"
+
+
+def generate_research_response(session_id, user_context):
+    """
+    Generate, parse and store the research response for a session.
+
+    On failure the session's saved answers are removed so the clarification
+    form can be submitted again.
+
+    Args:
+        session_id: ResearchSession primary key
+        user_context: List of {'question': ..., 'answer': ...} dicts
+
+    Returns:
+        None on success, otherwise a user-facing error message
+    """
+    session = ResearchSession.objects.get(id=session_id)
+
+    # A repeated submission for a session that already has its response
+    # has nothing to do
+    if ResearchResponse.objects.filter(session=session).exists():
+        logger.info(f"Research response already exists for session {session_id}, skipping")
+        return None
+
+    # The answers are gone if the job was expired or failed meanwhile; don't
+    # pay for a response nobody is waiting on
+    if not UserResponse.objects.filter(clarification__session=session).exists():
+        logger.info(f"Answers for session {session_id} no longer exist, skipping generation")
+        return None
+
+    client = get_claude_client()
+    response = client.generate_response(session.original_question, user_context)
+
+    if not response.success:
+        logger.error(f"Failed to generate response: {response.error_message}")
+        return _fail(session_id, f'Error generating research: {response.error_message}')
+
+    # Parse the response before opening the transaction
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to parse response JSON: {e}")
+        data = None
+
+    # Token log, response and status change commit together; the tokens are
+    # logged even when the content can't be parsed
+    with transaction.atomic():
+        TokenUsageLog.objects.create(
+            endpoint='respond',
+            model=response.token_usage.model,
+            prompt_tokens=response.token_usage.prompt_tokens,
+            completion_tokens=response.token_usage.completion_tokens,
+            cost_estimate=calculate_cost(response.token_usage),
+            session=session
+        )
+
+        if data is not None:
+            # get_or_create: a concurrent job may have stored one meanwhile
+            ResearchResponse.objects.get_or_create(
+                session=session,
+                defaults={
+                    'summary': data.get('summary', ''),
+                    # Convert markdown to HTML for detailed response
+                    'detailed_response': _render_markdown(data.get('analysis', '')),
+                    'links': data.get('links', []),
+                    'token_count': response.token_usage.total_tokens,
+                },
+            )
+
+            # Mark session as completed (only status changes; skip rewriting
+            # the question text and title)
+            session.status = 'completed'
+            session.save(update_fields=['status', 'updated_at'])
+
+    if data is None:
+        return _fail(session_id, 'Error processing AI response. Please try again.')
+
+    return None
+
+
+def _fail(session_id, message):
+    """Drop a session's answers so they can be resubmitted, and return message."""
+    UserResponse.objects.filter(clarification__session_id=session_id).delete()
+    return message
+
+
+def expire_stalled_generation(session_id, answered_at):
+    """
+    Fail a background generation that never started.
+
+    The in-process pool loses queued jobs when the worker is recycled or
+    killed, which would leave the session page polling forever. Running jobs
+    hold a lease (see _run_generation) and are left alone; the job token is
+    dropped so a queued job that starts late does nothing.
+
+    Args:
+        session_id: ResearchSession primary key
+        answered_at: When the clarification answers were submitted
+
+    Returns:
+        A user-facing error message if the generation timed out, else None
+    """
+    if timezone.now() - answered_at < timedelta(seconds=GENERATION_TIMEOUT_SECONDS):
+        return None
+    if cache.get(generation_started_key(session_id)) is not None:
+        return None
+
+    logger.warning(f"Research generation for session {session_id} never started, marking failed")
+    cache.delete(generation_job_key(session_id))
+    return _fail(session_id, 'Research generation timed out. Please try again.')
+
+
+def _run_generation(session_id, user_context, job_token):
+    """Pool entry point: run generation and record any failure in the cache."""
+    # Skip jobs that were expired (or superseded) while waiting in the queue
+    if cache.get(generation_job_key(session_id)) != job_token:
+        logger.info(f"Research job for session {session_id} is no longer current, skipping")
+        return
+
+    cache.set(generation_started_key(session_id), job_token, GENERATION_TIMEOUT_SECONDS)
+    close_old_connections()
+    try:
+        error = generate_research_response(session_id, user_context)
+    except Exception as e:
+        logger.exception(f"Research generation crashed for session {session_id}: {e}")
+        error = _fail(session_id, 'Error generating research. Please try again.')
+    finally:
+        close_old_connections()
+        cache.delete_many([generation_job_key(session_id), generation_started_key(session_id)])
+
+    if error:
+        cache.set(generation_error_key(session_id), error, GENERATION_ERROR_TTL)
+
+
+def _get_executor():
+    """Create the worker pool on first use (after any server fork)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.AI_BACKGROUND_WORKERS,
+                    thread_name_prefix='research-ai',
+                )
+    return _executor
+
+
+def enqueue_research_response(session_id, user_context):
+    """
+    Queue research generation for a session on the background pool.
+
+    Submission waits for the current transaction to commit so the worker
+    sees the saved answers. The job carries a token that
+    expire_stalled_generation revokes if the job never starts.
+    """
+    job_token = uuid.uuid4().hex
+    cache.delete(generation_error_key(session_id))
+    cache.set(generation_job_key(session_id), job_token, GENERATION_ERROR_TTL)
+    transaction.on_commit(
+        lambda: _get_executor().submit(_run_generation, session_id, user_context, job_token)
+    )
@@ -1,3 +1,182 @@
-from django.test import TestCase
+"""
+Tests for the research flow: clarification submission and background
+generation of research responses.
+"""
 
-# Create your tests here.
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from ai_service.client_interface import ClaudeResponse, TokenUsage
+from ai_service.live_client import API_MAX_RETRIES, API_TIMEOUT_SECONDS
+from research import tasks
+from research.models import (
+    ClarificationQuestion,
+    ResearchResponse,
+    ResearchSession,
+    UserResponse,
+)
+
+User = get_user_model()
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, USE_STUB_AI=True)
+class ResearchGenerationTestCase(TestCase):
+    """Test submitting clarifications and generating the research response"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
+
+        self.session = ResearchSession.objects.create(
+            title='Should I buy index funds?',
+            original_question='Should I buy index funds?',
+        )
+        self.clarifications = [
+            ClarificationQuestion.objects.create(
+                session=self.session, question_text=f'Question {i}?', order=i
+            )
+            for i in range(1, 3)
+        ]
+        self.answers = {f'answer_{c.id}': 'Long term' for c in self.clarifications}
+        self.user_context = [
+            {'question': c.question_text, 'answer': 'Long term'} for c in self.clarifications
+        ]
+        self.submit_url = reverse('research:submit_clarifications', args=[self.session.id])
+        self.detail_url = reverse('research:session_detail', args=[self.session.id])
+
+    def _save_answers(self):
+        UserResponse.objects.bulk_create([
+            UserResponse(clarification=c, response_text='Long term') for c in self.clarifications
+        ])
+
+    @override_settings(AI_BACKGROUND_WORKERS=0)
+    def test_inline_generation_renders_response(self):
+        """Test that submitting answers inline stores and shows the response"""
+        response = self.client.post(self.submit_url, self.answers)
+        self.assertRedirects(response, self.detail_url)
+
+        response = self.client.get(self.detail_url)
+        self.assertTemplateUsed(response, 'research/response.html')
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.status, 'completed')
+
+    @override_settings(AI_BACKGROUND_WORKERS=2)
+    def test_double_submit_enqueues_once(self):
+        """Test that a repeated submit doesn't queue a second generation"""
+        with mock.patch('research.views.enqueue_research_response') as enqueue:
+            self.client.post(self.submit_url, self.answers)
+            response = self.client.post(self.submit_url, self.answers)
+
+        self.assertEqual(enqueue.call_count, 1)
+        self.assertRedirects(response, self.detail_url)
+        self.assertEqual(UserResponse.objects.count(), len(self.clarifications))
+
+    @override_settings(AI_BACKGROUND_WORKERS=2)
+    def test_pending_generation_shows_progress(self):
+        """Test that the session page polls while generation is pending"""
+        with mock.patch('research.views.enqueue_research_response'):
+            self.client.post(self.submit_url, self.answers)
+
+        response = self.client.get(self.detail_url)
+        self.assertTemplateUsed(response, 'research/generating.html')
+
+    def test_never_started_generation_times_out(self):
+        """Test that a job that never started is failed after the timeout"""
+        self._save_answers()
+        cache.set(tasks.generation_job_key(self.session.id), 'token')
+        UserResponse.objects.update(
+            created_at=timezone.now() - timedelta(seconds=tasks.GENERATION_TIMEOUT_SECONDS + 1)
+        )
+
+        response = self.client.get(self.detail_url)
+        self.assertTemplateUsed(response, 'research/clarifications.html')
+        self.assertContains(response, 'timed out')
+        self.assertFalse(UserResponse.objects.exists())
+        self.assertIsNone(cache.get(tasks.generation_job_key(self.session.id)))
+
+    def test_started_generation_is_not_expired(self):
+        """Test that a running job keeps its answers past the timeout"""
+        self._save_answers()
+        cache.set(tasks.generation_started_key(self.session.id), 'token')
+        UserResponse.objects.update(
+            created_at=timezone.now() - timedelta(seconds=tasks.GENERATION_TIMEOUT_SECONDS + 1)
+        )
+
+        response = self.client.get(self.detail_url)
+        self.assertTemplateUsed(response, 'research/generating.html')
+        self.assertTrue(UserResponse.objects.exists())
+
+    def test_revoked_job_does_not_call_api(self):
+        """Test that a queued job expired before it started does nothing"""
+        self._save_answers()
+
+        with mock.patch('research.tasks.get_claude_client') as get_client:
+            tasks._run_generation(self.session.id, self.user_context, 'stale-token')
+
+        get_client.assert_not_called()
+        self.assertTrue(UserResponse.objects.exists())
+
+    def test_background_generation_stores_response(self):
+        """Test that a current job generates the response and clears its markers"""
+        self._save_answers()
+        cache.set(tasks.generation_job_key(self.session.id), 'token')
+
+        tasks._run_generation(self.session.id, self.user_context, 'token')
+
+        self.assertTrue(ResearchResponse.objects.filter(session=self.session).exists())
+        self.assertIsNone(cache.get(tasks.generation_job_key(self.session.id)))
+        self.assertIsNone(cache.get(tasks.generation_started_key(self.session.id)))
+
+    def test_background_failure_is_reported(self):
+        """Test that a failed job clears the answers and shows its error"""
+        self._save_answers()
+        cache.set(tasks.generation_job_key(self.session.id), 'token')
+        failed = ClaudeResponse(
+            content='',
+            token_usage=TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0, model='stub'),
+            success=False,
+            error_message='boom',
+        )
+
+        with mock.patch('research.tasks.get_claude_client') as get_client:
+            get_client.return_value.generate_response.return_value = failed
+            tasks._run_generation(self.session.id, self.user_context, 'token')
+
+        self.assertFalse(UserResponse.objects.exists())
+        response = self.client.get(self.detail_url)
+        self.assertTemplateUsed(response, 'research/clarifications.html')
+        self.assertContains(response, 'boom')
+
+    def test_generation_skips_existing_response(self):
+        """Test that generation is a no-op when a response already exists"""
+        self._save_answers()
+        ResearchResponse.objects.create(
+            session=self.session, summary='Done', detailed_response='<p>Done</p>'
+        )
+
+        with mock.patch('research.tasks.get_claude_client') as get_client:
+            self.assertIsNone(tasks.generate_research_response(self.session.id, self.user_context))
+        get_client.assert_not_called()
+
+    def test_generation_skips_deleted_answers(self):
+        """Test that generation doesn't call the API once the answers are gone"""
+        with mock.patch('research.tasks.get_claude_client') as get_client:
+            self.assertIsNone(tasks.generate_research_response(self.session.id, self.user_context))
+        get_client.assert_not_called()
+        self.assertFalse(ResearchResponse.objects.exists())
+
+    def test_client_timeout_fits_generation_lease(self):
+        """Test that the AI client's worst case finishes within the job lease"""
+        self.assertLess(
+            (API_MAX_RETRIES + 1) * API_TIMEOUT_SECONDS,
+            tasks.GENERATION_TIMEOUT_SECONDS,
+        )
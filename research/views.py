@@ -1,26 +1,38 @@
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, OuterRef, Prefetch, Subquery, prefetch_related_objects
 from .models import (
     ResearchSession,
     ClarificationQuestion,
     UserResponse,
-    ResearchResponse,
     ResearchNote
 )
+from .tasks import (
+    enqueue_research_response,
+    expire_stalled_generation,
+    generate_research_response,
+    generation_error_key,
+)
 from ai_service.client_factory import get_claude_client
 from ai_service.models import TokenUsageLog
 from ai_service.utils import calculate_cost
-import json
 import logging
-import markdown
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
 def home(request):
     """Home page with question form"""
-    recent_sessions = ResearchSession.objects.all()[:5]
+    # Only the columns the recent list shows; skips the question text
+    recent_sessions = ResearchSession.objects.only(
+        'id', 'title', 'status', 'created_at'
+    ).order_by('-created_at')[:5]
     return render(request, 'research/home.html', {
         'recent_sessions': recent_sessions
     })
@@ -40,13 +52,6 @@ def ask_question(request):
             'question': question
         })
 
-    # Create research session
-    session = ResearchSession.objects.create(
-        title=question[:200],  # Use first 200 chars as title
-        original_question=question,
-        status='in_progress'
-    )
-
     # Generate clarifications using AI client
     client = get_claude_client()
     response = client.generate_clarifications(question)
@@ -58,28 +63,38 @@ def ask_question(request):
             'question': question
         })
 
-    # Log token usage
-    TokenUsageLog.objects.create(
-        endpoint='clarify',
-        model=response.token_usage.model,
-        prompt_tokens=response.token_usage.prompt_tokens,
-        completion_tokens=response.token_usage.completion_tokens,
-        total_tokens=response.token_usage.total_tokens,
-        cost_estimate=calculate_cost(response.token_usage),
-        session=session
-    )
-
-    # Parse clarifications and create questions
+    # Parse clarifications before touching the database
     try:
-        clarifications = json.loads(response.content)
-        for i, q_text in enumerate(clarifications, 1):
-            ClarificationQuestion.objects.create(
-                session=session,
-                question_text=q_text,
-                order=i
-            )
-    except json.JSONDecodeError as e:
+        clarifications = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse clarifications JSON: {e}")
+        clarifications = None
+
+    # Create the session, its token usage log and questions in one transaction
+    with transaction.atomic():
+        session = ResearchSession.objects.create(
+            title=question[:200],  # Use first 200 chars as title
+            original_question=question,
+            status='in_progress'
+        )
+
+        # Log token usage
+        TokenUsageLog.objects.create(
+            endpoint='clarify',
+            model=response.token_usage.model,
+            prompt_tokens=response.token_usage.prompt_tokens,
+            completion_tokens=response.token_usage.completion_tokens,
+            cost_estimate=calculate_cost(response.token_usage),
+            session=session
+        )
+
+        if clarifications is not None:
+            ClarificationQuestion.objects.bulk_create([
+                ClarificationQuestion(session=session, question_text=q_text, order=i)
+                for i, q_text in enumerate(clarifications, 1)
+            ])
+
+    if clarifications is None:
         return render(request, 'research/home.html', {
             'error': 'Error processing AI response. Please try again.',
             'question': question
@@ -110,11 +125,18 @@ def submit_clarifications(request, session_id):
     session = get_object_or_404(ResearchSession, id=session_id)
     clarifications = session.clarifications.all()
 
-    # Save user responses
+    # A repeated submit (double click, back button) must not queue a second
+    # generation; the session page shows progress or the result
+    already_answered = UserResponse.objects.filter(clarification__session=session).exists()
+    if already_answered or hasattr(session, 'response'):
+        return redirect('research:session_detail', session_id=session.id)
+
+    # Validate all answers before writing anything
+    post_data = request.POST
+    user_responses = []
     user_context = []
     for clarification in clarifications:
-        answer_key = f'answer_{clarification.id}'
-        answer = request.POST.get(answer_key, '').strip()
+        answer = post_data.get(f'answer_{clarification.id}', '').strip()
 
         if not answer:
             return render(request, 'research/clarifications.html', {
@@ -123,84 +145,96 @@ def submit_clarifications(request, session_id):
                 'error': 'Please answer all questions.'
             })
 
-        # Save response
-        UserResponse.objects.create(
+        user_responses.append(UserResponse(
             clarification=clarification,
             response_text=answer
-        )
+        ))
 
         user_context.append({
             'question': clarification.question_text,
             'answer': answer
         })
 
-    # Generate research response
-    client = get_claude_client()
-    response = client.generate_response(session.original_question, user_context)
-
-    if not response.success:
-        logger.error(f"Failed to generate response: {response.error_message}")
-        return render(request, 'research/clarifications.html', {
-            'session': session,
-            'clarifications': clarifications,
-            'error': f'Error generating research: {response.error_message}'
-        })
-
-    # Log token usage
-    TokenUsageLog.objects.create(
-        endpoint='respond',
-        model=response.token_usage.model,
-        prompt_tokens=response.token_usage.prompt_tokens,
-        completion_tokens=response.token_usage.completion_tokens,
-        total_tokens=response.token_usage.total_tokens,
-        cost_estimate=calculate_cost(response.token_usage),
-        session=session
-    )
-
-    # Parse and save response
+    # Save user responses in a single multi-row INSERT; a concurrent
+    # submit that got there first wins
     try:
-        data = json.loads(response.content)
-
-        # Convert markdown to HTML for detailed response
-        md = markdown.Markdown(extensions=['extra', 'nl2br'])
-        detailed_html = md.convert(data.get('analysis', ''))
-
-        ResearchResponse.objects.create(
-            session=session,
-            summary=data.get('summary', ''),
-            detailed_response=detailed_html,
-            links=data.get('links', []),
-            token_count=response.token_usage.total_tokens
-        )
-
-        # Mark session as completed
-        session.status = 'completed'
-        session.save()
-
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse response JSON: {e}")
-        return render(request, 'research/clarifications.html', {
-            'session': session,
-            'clarifications': clarifications,
-            'error': 'Error processing AI response. Please try again.'
-        })
+        with transaction.atomic():
+            UserResponse.objects.bulk_create(user_responses)
+    except IntegrityError:
+        return redirect('research:session_detail', session_id=session.id)
+
+    # Generate the research response off the request path when a
+    # background pool is configured; the session page polls until it lands
+    if settings.AI_BACKGROUND_WORKERS:
+        enqueue_research_response(session.id, user_context)
+    else:
+        error = generate_research_response(session.id, user_context)
+        if error:
+            return render(request, 'research/clarifications.html', {
+                'session': session,
+                'clarifications': clarifications,
+                'error': error
+            })
 
-    # Redirect to response page
+    # Redirect to response page (a progress page while generation runs)
     return redirect('research:session_detail', session_id=session.id)
 
 
 @login_required
 def session_detail(request, session_id):
     """Display session and response"""
-    session = get_object_or_404(ResearchSession, id=session_id)
+    # One query answers "is there a response?" (select_related), "are there
+    # clarifications?" (Exists) and "when were they answered?" (Subquery)
+    # for the redirect checks
+    session = get_object_or_404(
+        ResearchSession.objects.select_related('response').annotate(
+            has_clarifications=Exists(
+                ClarificationQuestion.objects.filter(session=OuterRef('pk'))
+            ),
+            # When the answers were submitted (None if not yet answered)
+            answered_at=Subquery(
+                UserResponse.objects.filter(clarification__session=OuterRef('pk'))
+                .order_by('-created_at').values('created_at')[:1]
+            )
+        ),
+        id=session_id
+    )
 
     if not hasattr(session, 'response'):
         # Session not completed yet
-        if session.clarifications.exists():
+        error = cache.get(generation_error_key(session.id))
+        if not error and session.answered_at:
+            # Jobs lost with a recycled worker never report back
+            error = expire_stalled_generation(session.id, session.answered_at)
+        if error:
+            # Background generation failed; show the form again with the error
+            cache.delete(generation_error_key(session.id))
+            return render(request, 'research/clarifications.html', {
+                'session': session,
+                'clarifications': session.clarifications.all(),
+                'error': error
+            })
+        if session.answered_at:
+            # Answers submitted, response still being generated
+            return render(request, 'research/generating.html', {
+                'session': session
+            })
+        if session.has_clarifications:
             return redirect('research:clarifications', session_id=session.id)
         else:
             return redirect('research:home')
 
+    # Load the clarification answers and notes the template renders up front
+    # instead of one query per clarification/note access
+    prefetch_related_objects(
+        [session],
+        Prefetch(
+            'clarifications',
+            queryset=ClarificationQuestion.objects.select_related('user_response')
+        ),
+        'notes',
+    )
+
     return render(request, 'research/response.html', {
         'session': session,
         'response': session.response
@@ -210,9 +244,29 @@ def session_detail(request, session_id):
 @login_required
 def session_list(request):
     """List all research sessions"""
-    sessions = ResearchSession.objects.all()
+    # Annotate note counts so the template doesn't run a COUNT per session,
+    # and load only the columns the list renders. Meta.ordering is dropped
+    # from GROUP BY queries, so the order is explicit.
+    sessions = ResearchSession.objects.only(
+        'id', 'title', 'original_question', 'status', 'created_at'
+    ).annotate(note_count=Count('notes')).order_by('-created_at')
+
+    page_number = request.GET.get('page', 1)
+    paginator = Paginator(sessions, 50)  # 50 sessions per page
+    page_obj = paginator.get_page(page_number)
+    page_info = {
+        'current': page_obj.number,
+        'total_pages': paginator.num_pages,
+        'total_results': paginator.count,
+        'has_next': page_obj.has_next(),
+        'has_previous': page_obj.has_previous(),
+        'start_index': page_obj.start_index(),
+        'end_index': page_obj.end_index(),
+    }
+
     return render(request, 'research/session_list.html', {
-        'sessions': sessions
+        'sessions': page_obj.object_list,
+        'page_info': page_info,
     })
 
 
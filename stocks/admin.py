@@ -8,6 +8,9 @@ class WatchlistItemAdmin(admin.ModelAdmin):
     list_filter = ('status', 'added_date')
     search_fields = ('symbol', 'company_name', 'notes')
     readonly_fields = ('added_date',)
+    list_select_related = ('source_session',)
+    # Render the session as an id lookup rather than a <select> of every session
+    raw_id_fields = ('source_session',)
 
     fieldsets = (
         ('Stock Info', {
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-15 15:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("research", "0001_initial"),
+        ("stocks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="watchlistitem",
+            name="stocks_watc_status_7bb4bb_idx",
+        ),
+        migrations.AddIndex(
+            model_name="watchlistitem",
+            index=models.Index(
+                fields=["status", "-added_date"], name="stocks_watc_status_b8aed4_idx"
+            ),
+        ),
+    ]
@@ -28,7 +28,8 @@ class WatchlistItem(models.Model):
         ordering = ['-added_date']
         indexes = [
             models.Index(fields=['symbol']),
-            models.Index(fields=['status']),
+            # Matches the watchlist view: filter by status, newest first
+            models.Index(fields=['status', '-added_date']),
         ]
 
     def __str__(self):
@@ -1,5 +1,6 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
 from .models import WatchlistItem
 
 
@@ -8,13 +9,30 @@ def watchlist(request):
     """Display stock watchlist"""
     status_filter = request.GET.get('status', 'all')
 
-    if status_filter == 'all':
-        stocks = WatchlistItem.objects.all()
-    else:
-        stocks = WatchlistItem.objects.filter(status=status_filter)
+    # Load only the columns the cards render; the session link uses the raw FK
+    stocks = WatchlistItem.objects.only(
+        'id', 'symbol', 'company_name', 'status', 'added_date', 'notes',
+        'source_session',
+    )
+    if status_filter != 'all':
+        stocks = stocks.filter(status=status_filter)
+
+    page_number = request.GET.get('page', 1)
+    paginator = Paginator(stocks, 50)  # 50 stocks per page
+    page_obj = paginator.get_page(page_number)
+    page_info = {
+        'current': page_obj.number,
+        'total_pages': paginator.num_pages,
+        'total_results': paginator.count,
+        'has_next': page_obj.has_next(),
+        'has_previous': page_obj.has_previous(),
+        'start_index': page_obj.start_index(),
+        'end_index': page_obj.end_index(),
+    }
 
     return render(request, 'stocks/watchlist.html', {
-        'stocks': stocks,
+        'stocks': page_obj.object_list,
+        'page_info': page_info,
         'status_filter': status_filter
     })
 
@@ -29,9 +47,10 @@ def add_to_watchlist(request):
     company_name = request.POST.get('company_name', '').strip()
 
     if symbol:
-        WatchlistItem.objects.get_or_create(
-            symbol=symbol,
-            defaults={'company_name': company_name}
+        # Single INSERT ... ON CONFLICT DO NOTHING; an existing symbol is left as is
+        WatchlistItem.objects.bulk_create(
+            [WatchlistItem(symbol=symbol, company_name=company_name)],
+            ignore_conflicts=True
         )
 
     return redirect('stocks:watchlist')
@@ -34,7 +34,7 @@ class PreMarketMoverAdmin(admin.ModelAdmin):
     )
 
     def save_model(self, request, obj, form, change):
-        # Auto-calculate profit/loss if both prices exist
+        # Auto-calculate profit/loss if both prices exist; saved with the row below
         if obj.entry_price and obj.exit_price:
-            obj.calculate_profit_loss()
+            obj.calculate_profit_loss(save=False)
         super().save_model(request, obj, form, change)
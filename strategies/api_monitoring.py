@@ -7,6 +7,10 @@ and provide health metrics for operational monitoring.
 Usage:
     from strategies.api_monitoring import yfinance_monitor
 
+    with yfinance_monitor.record():
+        data = yf.Ticker('AAPL').info
+
+    # or, recording outcomes by hand:
     try:
         data = yf.Ticker('AAPL').info
         yfinance_monitor.record_call(success=True)
@@ -18,11 +22,32 @@ Usage:
 """
 
 from django.core.cache import cache
+from .cache_utils import get_redis_client
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+import atexit
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Number of recent latencies kept for the average calculation
+MAX_LATENCIES = 100
+
+# Buffered calls are written to the cache after this many calls or seconds
+FLUSH_EVERY_CALLS = 25
+FLUSH_INTERVAL_SECONDS = 1.0
+
+
+# Process-wide buffers of unflushed call outcomes, keyed by API name so every
+# monitor instance for the same API shares (and flushes) the same buffer.
+# Shared rather than thread-local so calls made on short-lived pool threads
+# are not lost when the thread exits.
+_buffers = {}
+_buffers_lock = threading.Lock()
+
 
 class ApiCallMonitor:
     """
@@ -37,16 +62,24 @@ class ApiCallMonitor:
         window_minutes: Time window for tracking calls (default 5 minutes)
     """
 
-    def __init__(self, api_name, rate_limit_threshold=0.05, window_minutes=5):
+    def __init__(self, api_name, rate_limit_threshold=0.05, window_minutes=5,
+                 flush_every=FLUSH_EVERY_CALLS, flush_interval=FLUSH_INTERVAL_SECONDS):
         self.api_name = api_name
         self.rate_limit_threshold = rate_limit_threshold
         self.window_minutes = window_minutes
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
         self._alert_cooldown_seconds = 300  # 5 minutes between alerts
 
     def record_call(self, success=True, response_code=None, latency_ms=None):
         """
         Record an API call outcome.
 
+        Calls are buffered in process and written to the cache in one batch
+        every `flush_every` calls or `flush_interval` seconds, whichever
+        comes first. The interval flush runs on a timer, so calls buffered
+        by an idle worker still reach the cache (and the rate limit check).
+
         Args:
             success: Whether the call succeeded (default True)
             response_code: HTTP response code (e.g., 200, 429, 500)
@@ -56,31 +89,132 @@ class ApiCallMonitor:
             monitor.record_call(success=True, response_code=200, latency_ms=150)
             monitor.record_call(success=False, response_code=429)
         """
-        key = f"api_monitor:{self.api_name}:calls"
-
-        try:
-            # Get current stats from cache
-            stats = cache.get(key, self._get_empty_stats())
-
-            # Update counters
-            stats['total'] += 1
+        with _buffers_lock:
+            pending = _buffers.get(self.api_name)
+            new_buffer = pending is None
+            if new_buffer:
+                pending = _buffers[self.api_name] = {
+                    'total': 0,
+                    'failed': 0,
+                    'rate_limited': 0,
+                    'latencies': deque(maxlen=MAX_LATENCIES),
+                }
+            pending['total'] += 1
             if not success:
-                stats['failed'] += 1
+                pending['failed'] += 1
             if response_code == 429:
-                stats['rate_limited'] += 1
+                pending['rate_limited'] += 1
             if latency_ms is not None:
-                stats['latencies'].append(latency_ms)
-                # Keep only last 100 latencies for average calculation
-                stats['latencies'] = stats['latencies'][-100:]
+                pending['latencies'].append(latency_ms)
+
+            should_flush = pending['total'] >= self.flush_every
+
+        if should_flush:
+            self.flush()
+        elif new_buffer:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Flush this API's buffer after flush_interval seconds on a daemon timer."""
+        timer = threading.Timer(self.flush_interval, self.flush)
+        timer.daemon = True
+        timer.start()
+
+    @contextmanager
+    def record(self):
+        """
+        Record the call made inside a with block, timing it automatically.
+
+        The call counts as successful unless the block raises; the exception
+        is recorded (with its HTTP status code, when it carries a response)
+        and re-raised.
+
+        Example:
+            with monitor.record():
+                data = yf.Ticker('AAPL').info
+        """
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            response = getattr(e, 'response', None)
+            self.record_call(
+                success=False,
+                response_code=getattr(response, 'status_code', None),
+                latency_ms=int((time.monotonic() - start) * 1000),
+            )
+            raise
+        self.record_call(
+            success=True,
+            response_code=200,
+            latency_ms=int((time.monotonic() - start) * 1000),
+        )
+
+    def flush(self):
+        """
+        Write the buffered call outcomes to the cache.
 
-            # Store updated stats (TTL = window in seconds)
-            cache.set(key, stats, timeout=self.window_minutes * 60)
+        The rate limit threshold is checked against the flushed aggregates.
+        """
+        with _buffers_lock:
+            pending = _buffers.pop(self.api_name, None)
+        if not pending or not pending['total']:
+            return
+
+        key = _stats_key(self)
+
+        try:
+            client = get_redis_client()
+            if client is not None:
+                stats = self._flush_redis(client, key, pending)
+            else:
+                # Get current stats from cache
+                stats = cache.get(key) or self._get_empty_stats()
+                latencies = stats['latencies']
+                if not isinstance(latencies, deque):
+                    # Entries written before latencies became a capped deque
+                    latencies = stats['latencies'] = deque(latencies, maxlen=MAX_LATENCIES)
+
+                # Update counters
+                stats['total'] += pending['total']
+                stats['failed'] += pending['failed']
+                stats['rate_limited'] += pending['rate_limited']
+                # Bounded deque drops the oldest latencies on extend
+                latencies.extend(pending['latencies'])
+
+                # Store updated stats (TTL = window in seconds)
+                cache.set(key, stats, timeout=self.window_minutes * 60)
 
             # Check if we need to trigger an alert
             self._check_rate_limit_threshold(stats)
 
         except Exception as e:
-            logger.error(f"Failed to record API call for {self.api_name}: {e}")
+            logger.error(f"Failed to record API calls for {self.api_name}: {e}")
+
+    def _flush_redis(self, client, key, pending):
+        """
+        Apply a batch of increments with server-side Redis operations.
+
+        Returns:
+            Dict with the updated 'total' and 'rate_limited' counters
+        """
+        counters_key = cache.make_key(key)
+        latencies_key = cache.make_key(f"{key}:latencies")
+        timeout = self.window_minutes * 60
+
+        pipe = client.pipeline()
+        pipe.hincrby(counters_key, 'total', pending['total'])
+        pipe.hincrby(counters_key, 'failed', pending['failed'])
+        pipe.hincrby(counters_key, 'rate_limited', pending['rate_limited'])
+        pipe.hsetnx(counters_key, 'start_time', datetime.now().isoformat())
+        pipe.expire(counters_key, timeout)
+        if pending['latencies']:
+            pipe.lpush(latencies_key, *pending['latencies'])
+            pipe.ltrim(latencies_key, 0, MAX_LATENCIES - 1)
+            pipe.expire(latencies_key, timeout)
+        total, _, rate_limited = pipe.execute()[:3]
+
+        return {'total': total, 'rate_limited': rate_limited}
 
     def _get_empty_stats(self):
         """Initialize empty statistics structure."""
@@ -88,7 +222,7 @@ class ApiCallMonitor:
             'total': 0,
             'failed': 0,
             'rate_limited': 0,
-            'latencies': [],
+            'latencies': deque(maxlen=MAX_LATENCIES),
             'start_time': datetime.now().isoformat(),
         }
 
@@ -159,9 +293,12 @@ class ApiCallMonitor:
             >>> stats = yfinance_monitor.get_stats()
             >>> print(f"Success rate: {stats['success_rate']:.1%}")
         """
-        key = f"api_monitor:{self.api_name}:calls"
-        stats = cache.get(key, self._get_empty_stats())
+        # Include calls still sitting in the buffer
+        self.flush()
+        return self._summarize(_read_raw_stats([self])[0])
 
+    def _summarize(self, stats):
+        """Turn raw counters into the statistics dict returned by get_stats."""
         # Calculate derived metrics
         success_count = stats['total'] - stats['failed']
         success_rate = success_count / stats['total'] if stats['total'] > 0 else 0.0
@@ -194,11 +331,70 @@ class ApiCallMonitor:
 
         Useful for testing or after fixing rate limit issues.
         """
-        key = f"api_monitor:{self.api_name}:calls"
-        cache.delete(key)
+        _delete_stats([self])
         logger.info(f"Reset statistics for {self.api_name}")
 
 
+def _stats_key(monitor):
+    """Cache key of a monitor's stats (latencies live under '<key>:latencies')."""
+    return f"api_monitor:{monitor.api_name}:calls"
+
+
+def _read_raw_stats(monitors):
+    """
+    Read raw counters for several monitors in a single cache round trip.
+
+    Uses one Redis pipeline (HGETALL + LRANGE per monitor) with django-redis,
+    and cache.get_many() on other backends.
+
+    Returns:
+        List of raw stats dicts, in the same order as monitors
+    """
+    client = get_redis_client()
+    if client is None:
+        keys = [_stats_key(monitor) for monitor in monitors]
+        found = cache.get_many(keys)
+        return [
+            found.get(key) or monitor._get_empty_stats()
+            for monitor, key in zip(monitors, keys)
+        ]
+
+    pipe = client.pipeline()
+    for monitor in monitors:
+        key = _stats_key(monitor)
+        pipe.hgetall(cache.make_key(key))
+        pipe.lrange(cache.make_key(f"{key}:latencies"), 0, -1)
+    results = pipe.execute()
+
+    raw_stats = []
+    for counters, latencies in zip(results[::2], results[1::2]):
+        counters = {k.decode(): v.decode() for k, v in counters.items()}
+        raw_stats.append({
+            'total': int(counters.get('total', 0)),
+            'failed': int(counters.get('failed', 0)),
+            'rate_limited': int(counters.get('rate_limited', 0)),
+            'latencies': [float(latency) for latency in latencies],
+            'start_time': counters.get('start_time'),
+        })
+    return raw_stats
+
+
+def _delete_stats(monitors):
+    """Drop buffered and stored stats for several monitors in one round trip."""
+    with _buffers_lock:
+        for monitor in monitors:
+            _buffers.pop(monitor.api_name, None)
+
+    keys = [_stats_key(monitor) for monitor in monitors]
+    client = get_redis_client()
+    if client is not None:
+        client.delete(*[
+            cache.make_key(k) for key in keys for k in (key, f"{key}:latencies")
+        ])
+    else:
+        cache.delete_many(keys)
+
+
 # Global monitor instances
 # These track API calls across the application
 
@@ -214,6 +410,18 @@ finnhub_monitor = ApiCallMonitor(
     window_minutes=5
 )
 
+MONITORS = (yfinance_monitor, finnhub_monitor)
+
+
+def _flush_all():
+    """Write out buffered calls for every global monitor."""
+    for monitor in MONITORS:
+        monitor.flush()
+
+
+# Short-lived processes (management commands) exit with calls still buffered
+atexit.register(_flush_all)
+
 logger.info(
     f"API monitors initialized: {yfinance_monitor.api_name} (5% threshold), "
     f"{finnhub_monitor.api_name} (5% threshold)"
@@ -232,14 +440,17 @@ def get_all_api_stats():
         >>> for api, stats in all_stats.items():
         ...     print(f"{api}: {stats['success_rate']:.1%} success")
     """
+    _flush_all()
+
+    # One pipelined / get_many read for every monitor
+    raw_stats = _read_raw_stats(MONITORS)
     return {
-        'yfinance': yfinance_monitor.get_stats(),
-        'finnhub': finnhub_monitor.get_stats(),
+        monitor.api_name: monitor._summarize(stats)
+        for monitor, stats in zip(MONITORS, raw_stats)
     }
 
 
 def reset_all_stats():
     """Reset statistics for all monitored APIs."""
-    yfinance_monitor.reset_stats()
-    finnhub_monitor.reset_stats()
+    _delete_stats(MONITORS)
     logger.info("Reset all API monitoring statistics")
@@ -17,11 +17,64 @@ from functools import wraps
 import hashlib
 import json
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-
-def cached(ttl_seconds=300, key_prefix=''):
+# Single-flight settings: how long a recompute lock lives, and how long other
+# callers poll for the winner's result before computing it themselves
+LOCK_TIMEOUT = 5
+LOCK_WAIT_SECONDS = 3.0
+LOCK_POLL_INITIAL = 0.05
+
+# Sentinel distinguishing a cache miss from a cached None/False
+MISS = object()
+
+# Default TTL for empty results, see cached()
+NEGATIVE_TTL = 60
+
+# Argument types whose repr is already a stable, canonical key component
+_PRIMITIVE_TYPES = (str, int, float, bool, tuple)
+
+
+def _canonical_json(value):
+    """Serialize a value to compact JSON with sorted keys."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def _normalize_other(arg):
+    """Normalize an argument whose exact type isn't in _ARG_NORMALIZERS."""
+    if arg is None or isinstance(arg, _PRIMITIVE_TYPES):
+        # Subclasses of primitives (and tuples of them) have a stable repr
+        return repr(arg)
+    if isinstance(arg, (dict, list)):
+        # Serialize dicts/lists to JSON with sorted keys
+        return _canonical_json(arg)
+    if hasattr(arg, '__dict__'):
+        # Handle objects by serializing their __dict__
+        try:
+            return _canonical_json(arg.__dict__)
+        except (TypeError, ValueError):
+            # Fallback to string representation
+            return str(arg)
+    return str(arg)
+
+
+# Exact-type dispatch for the common argument types; one dict lookup instead
+# of a chain of isinstance/hasattr checks per argument
+_ARG_NORMALIZERS = {
+    str: repr,
+    int: repr,
+    float: repr,
+    bool: repr,
+    type(None): repr,
+    tuple: repr,
+    dict: _canonical_json,
+    list: _canonical_json,
+}
+
+
+def cached(ttl_seconds=300, key_prefix='', negative_ttl_seconds=NEGATIVE_TTL):
     """
     Decorator for caching function results with stable key generation.
 
@@ -29,8 +82,12 @@ def cached(ttl_seconds=300, key_prefix=''):
     to JSON with sorted keys for consistent hash generation.
 
     Args:
-        ttl_seconds: Time to live in seconds (default 300 = 5 minutes)
+        ttl_seconds: Time to live in seconds (default 300 = 5 minutes), or
+            a zero-argument callable returning it, evaluated at store time
+            (e.g. shorter while the market is open)
         key_prefix: Prefix for cache key namespace (e.g., 'stock_data')
+        negative_ttl_seconds: TTL for empty results (None, False, empty
+            containers) so failed lookups are cached briefly (default 60)
 
     Returns:
         Decorated function that caches results
@@ -41,16 +98,25 @@ def cached(ttl_seconds=300, key_prefix=''):
             return yf.Ticker('SPY').info['regularMarketPrice']
 
     Note:
-        - Cache keys are MD5 hashes of function name + normalized args
+        - Cache keys are BLAKE2b hashes of function name + normalized args
         - If key generation fails, function executes without caching
         - Cache misses are logged at DEBUG level for monitoring
+        - Concurrent misses on the same key are single-flighted: one caller
+          recomputes under a short cache.add() lock while the others wait
+        - Callers reusing the same dict/list arguments can compute the key
+          once with `func.make_key(*args, **kwargs)` and pass it back as
+          `func(*args, cache_key=key, **kwargs)` to skip re-serialization
+        - `func.refresh(*args, **kwargs)` recomputes and re-caches a result
+          regardless of what is cached, for background cache warming
     """
     def decorator(func):
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Generate stable cache key
+        def wrapper(*args, cache_key=None, **kwargs):
+            # Generate stable cache key, unless the caller precomputed one
+            # with wrapper.make_key() for arguments it passes repeatedly
             try:
-                cache_key = _generate_cache_key(func, args, kwargs, key_prefix)
+                if cache_key is None:
+                    cache_key = _generate_cache_key(func, args, kwargs, key_prefix)
             except (TypeError, ValueError) as e:
                 # If key generation fails, skip caching and execute function
                 logger.warning(
@@ -59,22 +125,60 @@ def cached(ttl_seconds=300, key_prefix=''):
                 )
                 return func(*args, **kwargs)
 
-            # Try to get cached value
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
+            # Try to get cached value (a cached None/False is still a hit)
+            cached_value = cache.get(cache_key, MISS)
+            if cached_value is not MISS:
                 logger.debug(f"Cache HIT: {func.__name__} (key: {cache_key[:8]}...)")
                 return cached_value
 
-            # Cache miss - execute function
+            # Cache miss - let a single caller recompute while others wait
             logger.debug(f"Cache MISS: {func.__name__} (key: {cache_key[:8]}...)")
-            result = func(*args, **kwargs)
+            lock_key = f"{cache_key}:lock"
+            try:
+                acquired = cache.add(lock_key, 1, LOCK_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Cache lock failed for {func.__name__}: {e}")
+                acquired = True  # Backend trouble: compute without coordination
+
+            if acquired:
+                # Another caller may have filled the key and released its
+                # lock between our miss and the add(); don't recompute
+                cached_value = cache.get(cache_key, MISS)
+                if cached_value is not MISS:
+                    _release_lock(lock_key)
+                    return cached_value
+            else:
+                cached_value = _wait_for_value(cache_key, lock_key)
+                if cached_value is not MISS:
+                    logger.debug(
+                        f"Cache HIT after wait: {func.__name__} (key: {cache_key[:8]}...)"
+                    )
+                    return cached_value
+                logger.debug(
+                    f"Timed out waiting for {func.__name__} (key: {cache_key[:8]}...), "
+                    f"computing locally"
+                )
+
+            try:
+                result = func(*args, **kwargs)
+                store(cache_key, result)
+            finally:
+                if acquired:
+                    _release_lock(lock_key)
+
+            return result
 
-            # Store result in cache
+        def store(cache_key, result):
+            # Empty results expire sooner so a transient failure isn't
+            # remembered for the full TTL
+            timeout = ttl_seconds() if callable(ttl_seconds) else ttl_seconds
+            if _is_negative(result):
+                timeout = min(timeout, negative_ttl_seconds)
             try:
-                cache.set(cache_key, result, ttl_seconds)
+                cache.set(cache_key, result, timeout)
                 logger.debug(
                     f"Cached result for {func.__name__} "
-                    f"(TTL: {ttl_seconds}s, key: {cache_key[:8]}...)"
+                    f"(TTL: {timeout}s, key: {cache_key[:8]}...)"
                 )
             except Exception as e:
                 logger.warning(
@@ -82,6 +186,10 @@ def cached(ttl_seconds=300, key_prefix=''):
                     f"Result returned but not cached."
                 )
 
+        def refresh(*args, **kwargs):
+            """Recompute and store a result even if a cached one is still fresh."""
+            result = func(*args, **kwargs)
+            store(_generate_cache_key(func, args, kwargs, key_prefix), result)
             return result
 
         # Add cache inspection method
@@ -91,16 +199,63 @@ def cached(ttl_seconds=300, key_prefix=''):
             'prefix': key_prefix,
         }
 
+        # Precompute a cache key for arguments that will be passed repeatedly
+        wrapper.make_key = lambda *args, **kwargs: _generate_cache_key(
+            func, args, kwargs, key_prefix
+        )
+
+        # Warm an entry ahead of expiry so readers never see the miss
+        wrapper.refresh = refresh
+
         return wrapper
     return decorator
 
 
+def _is_negative(result):
+    """Whether a result is an empty/failed lookup (None, False, empty container)."""
+    if result is None or result is False:
+        return True
+    try:
+        return len(result) == 0
+    except TypeError:
+        return False
+
+
+def _release_lock(lock_key):
+    """Delete a single-flight lock, ignoring backend errors."""
+    try:
+        cache.delete(lock_key)
+    except Exception:
+        pass
+
+
+def _wait_for_value(cache_key, lock_key):
+    """
+    Poll the cache with exponential backoff until another caller fills it.
+
+    Stops early once the lock is released, since the winner has then either
+    stored its result or produced nothing cacheable.
+
+    Returns:
+        The cached value, or MISS if nothing appeared within LOCK_WAIT_SECONDS
+    """
+    delay = LOCK_POLL_INITIAL
+    deadline = time.monotonic() + LOCK_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        value = cache.get(cache_key, MISS)
+        if value is not MISS or cache.get(lock_key) is None:
+            return value
+        delay = min(delay * 2, 0.5)
+    return MISS
+
+
 def _generate_cache_key(func, args, kwargs, key_prefix):
     """
     Generate a stable cache key from function name and arguments.
 
-    Handles complex types (dicts, lists, objects) by serializing to JSON
-    with sorted keys to ensure consistent hashing.
+    Primitives are keyed by their repr; complex types (dicts, lists, objects)
+    are serialized to JSON with sorted keys to ensure consistent hashing.
 
     Args:
         func: Function being cached
@@ -109,39 +264,33 @@ def _generate_cache_key(func, args, kwargs, key_prefix):
         key_prefix: Prefix for namespace isolation
 
     Returns:
-        32-character MD5 hash string
+        32-character BLAKE2b hex digest
 
     Raises:
         TypeError: If arguments cannot be serialized
         ValueError: If arguments contain unsupported types
     """
-    # Normalize positional arguments
-    normalized_args = []
-    for arg in args:
-        if isinstance(arg, (dict, list)):
-            # Serialize dicts/lists to JSON with sorted keys
-            normalized_args.append(json.dumps(arg, sort_keys=True, default=str))
-        elif hasattr(arg, '__dict__'):
-            # Handle objects by serializing their __dict__
-            try:
-                normalized_args.append(json.dumps(arg.__dict__, sort_keys=True, default=str))
-            except (TypeError, ValueError):
-                # Fallback to string representation
-                normalized_args.append(str(arg))
-        else:
-            # Primitives (str, int, float, bool, None) are safe
-            normalized_args.append(str(arg))
+    name = func.__name__
+
+    if not kwargs and len(args) == 1 and type(args[0]) is str:
+        # Fast path for the common single-symbol call, e.g. get_stock_data('AAPL');
+        # builds the same string as the general path below
+        key_str = f"{key_prefix}:{name}:{args[0]!r}" if key_prefix else f"{name}:{args[0]!r}"
+    else:
+        # Normalize positional arguments
+        get_normalizer = _ARG_NORMALIZERS.get
+        key_parts = [key_prefix, name]
+        key_parts += [get_normalizer(type(arg), _normalize_other)(arg) for arg in args]
 
-    # Include kwargs in key (sorted for stability)
-    if kwargs:
-        normalized_args.append(json.dumps(kwargs, sort_keys=True, default=str))
+        # Include kwargs in key (sorted for stability)
+        if kwargs:
+            key_parts.append(_canonical_json(kwargs))
 
-    # Build cache key: prefix:function_name:arg1:arg2:...
-    key_parts = [key_prefix, func.__name__] + normalized_args
-    key_str = ':'.join(filter(None, key_parts))  # filter removes empty strings
+        # Build cache key: prefix:function_name:arg1:arg2:...
+        key_str = ':'.join(filter(None, key_parts))  # filter removes empty strings
 
-    # Generate MD5 hash (32 characters, safe for cache keys)
-    cache_key = hashlib.md5(key_str.encode('utf-8')).hexdigest()
+    # BLAKE2b with a 16-byte digest keeps keys at 32 hex characters
+    cache_key = hashlib.blake2b(key_str.encode('utf-8'), digest_size=16).hexdigest()
 
     return cache_key
 
@@ -203,6 +352,20 @@ def get_cache_stats():
         return None
 
 
+def get_redis_client():
+    """
+    Return the raw Redis client behind the default cache, or None.
+
+    With django-redis, callers can use native Redis structures (hashes,
+    lists, sorted sets) for atomic server-side updates. Other backends (file
+    cache in development) return None and callers fall back to cache.get/set.
+    """
+    client = getattr(cache, 'client', None)
+    if client is None or not hasattr(client, 'get_client'):
+        return None
+    return client.get_client(write=True)
+
+
 # Convenience function for manual cache invalidation
 def invalidate_cache(func, *args, **kwargs):
     """
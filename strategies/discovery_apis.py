@@ -4,13 +4,31 @@ Discovery APIs - External APIs for market mover discovery
 Provides interfaces to APIs that can discover pre-market movers without
 requiring a predefined symbol list.
 """
+import orjson
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
 from django.conf import settings
 
+from .cache_utils import cached
+from .http_session import http_session, REQUEST_TIMEOUT
+
 logger = logging.getLogger(__name__)
 
+# FMP refreshes gainers/losers/actives every 15 minutes
+LIST_CACHE_TTL = 600
+
+# Symbols per /quote request (FMP accepts a comma-separated list)
+QUOTE_CHUNK_SIZE = 100
+
+# /stock_news limit is global across tickers, so scale it with the batch:
+# a few articles per symbol keeps busy tickers from crowding out the rest
+NEWS_ARTICLES_PER_SYMBOL = 5
+MIN_NEWS_LIMIT = 50
+
 
 class FMPClient:
     """
@@ -59,20 +77,39 @@ class FMPClient:
 
         try:
             logger.info(f"Fetching FMP data from {endpoint}")
-            response = requests.get(url, params=request_params, timeout=10)
+            response = http_session.get(url, params=request_params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"FMP returned {len(data) if isinstance(data, list) else 'non-list'} results")
             return data
 
         except requests.exceptions.RequestException as e:
             logger.error(f"FMP API request failed for {endpoint}: {e}")
             return None
-        except ValueError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse FMP JSON response: {e}")
             return None
 
+    @cached(ttl_seconds=LIST_CACHE_TTL, key_prefix='fmp_list')
+    def _fetch_list(self, endpoint: str) -> List[Dict]:
+        """
+        Fetch a full mover list from FMP, cached between refreshes
+
+        FMP only updates these lists every 15 minutes, so repeated scans
+        within the TTL are served from cache. The cache is keyed by endpoint
+        alone so callers asking for different limits share one entry; each
+        caller slices the list it needs.
+
+        Args:
+            endpoint: API endpoint (e.g., '/gainers')
+
+        Returns:
+            List of dict responses (empty if the request failed)
+        """
+        data = self._make_request(endpoint)
+        return data if isinstance(data, list) else []
+
     def get_gainers(self, limit: int = 20) -> List[Dict]:
         """
         Get top gainers from FMP (FREE TIER)
@@ -83,12 +120,7 @@ class FMPClient:
         Returns:
             List of dicts with keys: symbol, name, price, changesPercentage, change
         """
-        data = self._make_request('/gainers')
-        if data is None:
-            return []
-
-        # FMP returns all gainers, limit to requested count
-        return data[:limit] if isinstance(data, list) else []
+        return self._fetch_list('/gainers')[:limit]
 
     def get_losers(self, limit: int = 20) -> List[Dict]:
         """
@@ -100,11 +132,7 @@ class FMPClient:
         Returns:
             List of dicts with keys: symbol, name, price, changesPercentage, change
         """
-        data = self._make_request('/losers')
-        if data is None:
-            return []
-
-        return data[:limit] if isinstance(data, list) else []
+        return self._fetch_list('/losers')[:limit]
 
     def get_actives(self, limit: int = 20) -> List[Dict]:
         """
@@ -116,11 +144,7 @@ class FMPClient:
         Returns:
             List of dicts with keys: symbol, name, price, changesPercentage, change
         """
-        data = self._make_request('/actives')
-        if data is None:
-            return []
-
-        return data[:limit] if isinstance(data, list) else []
+        return self._fetch_list('/actives')[:limit]
 
     def get_gainers_and_losers(self, limit: int = 20) -> List[Dict]:
         """
@@ -132,16 +156,138 @@ class FMPClient:
         Returns:
             Combined list sorted by absolute percent change
         """
-        gainers = self.get_gainers(limit)
-        losers = self.get_losers(limit)
+        # Both endpoints are I/O-bound; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gainers_future = executor.submit(self.get_gainers, limit)
+            losers_future = executor.submit(self.get_losers, limit)
+            gainers, losers = gainers_future.result(), losers_future.result()
 
         combined = gainers + losers
 
-        # Sort by absolute percent change (biggest movers first)
-        combined.sort(key=lambda x: abs(x.get('changesPercentage', 0)), reverse=True)
+        # Sort by absolute percent change (biggest movers first); sort computes
+        # the key once per item, and every item is returned, so a full sort
+        # is already the cheapest option here
+        combined.sort(key=_abs_change, reverse=True)
 
         return combined
 
+    def get_quotes_bulk(self, symbols: List[str], chunk_size: int = QUOTE_CHUNK_SIZE) -> Dict[str, Dict]:
+        """
+        Get real-time quotes for many symbols with batched /quote requests
+
+        Symbols are sent in chunks of chunk_size per request, and chunks are
+        fetched concurrently, so N symbols cost ceil(N / chunk_size) calls.
+
+        Args:
+            symbols: Ticker symbols to quote
+            chunk_size: Symbols per request (default 100)
+
+        Returns:
+            Dict mapping symbol to quote dict with keys: symbol, name, price,
+            changesPercentage, previousClose, volume, avgVolume, marketCap
+        """
+        if not symbols or not self.api_key:
+            return {}
+
+        chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+        with ThreadPoolExecutor(max_workers=min(len(chunks), 4)) as executor:
+            results = executor.map(
+                lambda chunk: self._make_request(f"/quote/{','.join(chunk)}"),
+                chunks
+            )
+
+            quotes = {}
+            for data in results:
+                if isinstance(data, list):
+                    quotes.update((q['symbol'], q) for q in data if q.get('symbol'))
+
+        return quotes
+
+    def get_news_batch(self, symbols: List[str], limit: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Get the most recent news article for many symbols in one request
+
+        Uses FMP's multi-ticker /stock_news endpoint, so N symbols cost one
+        round trip. Symbols without an article in the returned window are
+        absent from the result.
+
+        Args:
+            symbols: Ticker symbols to fetch news for
+            limit: Maximum articles returned across all symbols (defaults to
+                NEWS_ARTICLES_PER_SYMBOL per symbol, at least MIN_NEWS_LIMIT)
+
+        Returns:
+            Dict mapping symbol to article dict with keys: headline, summary,
+            source, url, datetime (same shape as Finnhub articles)
+        """
+        if not symbols or not self.api_key:
+            return {}
+
+        if limit is None:
+            limit = max(MIN_NEWS_LIMIT, NEWS_ARTICLES_PER_SYMBOL * len(symbols))
+
+        data = self._make_request('/stock_news', {
+            'tickers': ','.join(symbols),
+            'limit': limit,
+        })
+        if not isinstance(data, list):
+            return {}
+
+        news = {}
+        for item in data:
+            symbol = item.get('symbol')
+            published = _parse_fmp_datetime(item.get('publishedDate'))
+            if symbol is None or (symbol in news and news[symbol]['datetime'] >= published):
+                continue
+            news[symbol] = {
+                'headline': item.get('title', 'No headline'),
+                'summary': item.get('text', ''),
+                'source': item.get('site', 'Unknown'),
+                'url': item.get('url', ''),
+                'datetime': published,
+            }
+
+        return news
+
+
+def _abs_change(item: Dict) -> float:
+    """Sort key: absolute percent change (FMP may send null)."""
+    return abs(item.get('changesPercentage') or 0)
+
+
+def _parse_fmp_datetime(value: Optional[str]) -> datetime:
+    """Parse FMP's 'YYYY-MM-DD HH:MM:SS' timestamps (epoch on failure)."""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return datetime.fromtimestamp(0)
+
+
+@lru_cache(maxsize=1)
+def _default_client() -> FMPClient:
+    """Shared FMPClient for the module-level helpers."""
+    return FMPClient()
+
+
+def get_quotes_bulk(symbols: List[str]) -> Dict[str, Dict]:
+    """
+    Get FMP quotes for many symbols in ceil(N / 100) requests.
+
+    Returns:
+        Dict mapping symbol to quote dict (empty if FMP isn't configured)
+    """
+    return _default_client().get_quotes_bulk(symbols)
+
+
+def get_news_batch(symbols: List[str]) -> Dict[str, Dict]:
+    """
+    Get the most recent FMP news article per symbol in a single request.
+
+    Returns:
+        Dict mapping symbol to article dict (empty if FMP isn't configured)
+    """
+    return _default_client().get_news_batch(symbols)
+
 
 def test_fmp_connection():
     """
@@ -163,9 +309,14 @@ def test_fmp_connection():
         print("2. Add FMP_API_KEY=your_key_here to .env")
         return
 
+    # Fetch both endpoints concurrently; results are reported in order below
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        gainers_future = executor.submit(client.get_gainers, 5)
+        losers_future = executor.submit(client.get_losers, 5)
+        gainers, losers = gainers_future.result(), losers_future.result()
+
     # Test gainers endpoint
     print("Testing /gainers (FREE TIER)...")
-    gainers = client.get_gainers(limit=5)
 
     if gainers:
         print(f"✅ SUCCESS: Retrieved {len(gainers)} gainers\n")
@@ -181,7 +332,6 @@ def test_fmp_connection():
     # Test losers endpoint
     print("\n" + "-"*60)
     print("Testing /losers (FREE TIER)...")
-    losers = client.get_losers(limit=5)
 
     if losers:
         print(f"✅ SUCCESS: Retrieved {len(losers)} losers\n")
@@ -11,19 +11,41 @@ Phase 3 Enhancements:
 - API call monitoring for health metrics
 """
 
+import asyncio
+import heapq
+import httpx
+import orjson
 import requests
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from django.conf import settings
+from django.core.cache import cache
 
 # Phase 3: Import infrastructure utilities
-from .cache_utils import cached
+from .cache_utils import cached, NEGATIVE_TTL
 from .api_monitoring import finnhub_monitor
+from .http_session import http_session, REQUEST_TIMEOUT
+from .rate_limiter import finnhub_limiter
 
 logger = logging.getLogger(__name__)
 
 FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
 
+# News doesn't change rapidly
+NEWS_CACHE_TTL = 900
+
+# Async requests in flight at once; finnhub_limiter still paces their starts
+MAX_CONCURRENT_REQUESTS = 5
+
+# Retries for a 429 response, backing off 1s, 2s, 4s (or per Retry-After)
+RATE_LIMIT_RETRIES = 3
+
+
+@finnhub_limiter
+def _take_finnhub_slot():
+    """Block until finnhub_limiter grants a request slot."""
+
 
 class FinnhubClient:
     """Client for interacting with Finnhub API."""
@@ -46,36 +68,34 @@ class FinnhubClient:
         params['token'] = self.api_key
         url = f"{FINNHUB_BASE_URL}/{endpoint}"
 
+        _take_finnhub_slot()
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = http_session.get(url, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             logger.error(f"Finnhub API request failed: {e}")
             return None
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse Finnhub JSON response: {e}")
+            return None
 
-    @cached(ttl_seconds=900, key_prefix='finnhub_news')  # 15-minute cache
-    def get_company_news(self, symbol, days_back=7):
+    @cached(ttl_seconds=NEWS_CACHE_TTL, key_prefix='finnhub_news')  # 15-minute cache
+    def get_company_news(self, symbol, from_date, to_date):
         """
-        Fetch recent company news with caching.
+        Fetch company news in a date window with caching.
 
         Phase 3: Cached for 15 minutes (news doesn't change rapidly)
 
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
-            days_back: Number of days to look back (default 7)
+            from_date: Window start as 'YYYY-MM-DD' (see news_date_range)
+            to_date: Window end as 'YYYY-MM-DD'
 
         Returns:
             List of news articles with headline, summary, source, url, datetime
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
-
-        params = {
-            'symbol': symbol.upper(),
-            'from': start_date.strftime('%Y-%m-%d'),
-            'to': end_date.strftime('%Y-%m-%d')
-        }
+        params = _company_news_params(symbol, from_date, to_date)
 
         # Track API call for monitoring
         try:
@@ -85,28 +105,117 @@ class FinnhubClient:
             finnhub_monitor.record_call(success=False, response_code=None)
             raise
 
-        if not data:
-            return []
+        articles = _parse_company_news(data)
+        logger.info(f"Fetched {len(articles)} news articles for {symbol}")
+        return articles
 
-        # Parse and format news articles
-        articles = []
-        for item in data[:10]:  # Limit to 10 most recent
-            articles.append({
-                'headline': item.get('headline', 'No headline'),
-                'summary': item.get('summary', ''),
-                'source': item.get('source', 'Unknown'),
-                'url': item.get('url', ''),
-                'datetime': datetime.fromtimestamp(item.get('datetime', 0)),
-                'category': item.get('category', ''),
-                'related': item.get('related', '')
-            })
+    async def _amake_request(self, client, endpoint, params=None):
+        """
+        Async counterpart of _make_request using a shared httpx.AsyncClient.
+
+        Each attempt takes a finnhub_limiter slot (in a worker thread, so the
+        event loop keeps running), and 429 responses are retried with backoff.
+        """
+        if not self.api_key:
+            logger.error("Cannot make Finnhub request - API key not configured")
+            return None
+
+        if params is None:
+            params = {}
+
+        params['token'] = self.api_key
+        url = f"{FINNHUB_BASE_URL}/{endpoint}"
+
+        try:
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                await asyncio.to_thread(_take_finnhub_slot)
+                response = await client.get(url, params=params)
+                if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                    break
+                finnhub_monitor.record_call(success=False, response_code=429)
+                delay = _retry_after(response, default=2 ** attempt)
+                logger.warning(f"Finnhub rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Finnhub API request failed: {e}")
+            return None
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse Finnhub JSON response: {e}")
+            return None
+
+    async def get_company_news_async(self, client, symbol, from_date, to_date):
+        """
+        Async variant of get_company_news sharing its cache entries.
+
+        Args:
+            client: Open httpx.AsyncClient
+            symbol: Stock ticker symbol (e.g., 'AAPL')
+            from_date: Window start as 'YYYY-MM-DD'
+            to_date: Window end as 'YYYY-MM-DD'
+
+        Returns:
+            List of news articles, most recent first
+        """
+        # Same key as get_company_news(symbol, from_date, to_date) so both paths share entries
+        cache_key = FinnhubClient.get_company_news.make_key(self, symbol, from_date, to_date)
+        articles = cache.get(cache_key)
+        if articles is not None:
+            return articles
+
+        params = _company_news_params(symbol, from_date, to_date)
 
-        # Sort by datetime, most recent first
-        articles.sort(key=lambda x: x['datetime'], reverse=True)
+        # Track API call for monitoring
+        try:
+            data = await self._amake_request(client, 'company-news', params)
+            finnhub_monitor.record_call(success=True, response_code=200)
+        except Exception:
+            finnhub_monitor.record_call(success=False, response_code=None)
+            raise
 
+        articles = _parse_company_news(data)
+        cache.set(cache_key, articles, NEWS_CACHE_TTL if articles else NEGATIVE_TTL)
         logger.info(f"Fetched {len(articles)} news articles for {symbol}")
         return articles
 
+    async def fetch_news_bulk(self, symbols, days_back=7):
+        """
+        Fetch company news for many symbols concurrently.
+
+        All requests share one connection pool. At most
+        MAX_CONCURRENT_REQUESTS are in flight, and finnhub_limiter paces
+        them to the plan's rate, so large batches queue instead of drawing 429s.
+
+        Args:
+            symbols: Iterable of ticker symbols
+            days_back: Number of days to look back (default 7)
+
+        Returns:
+            List aligned with symbols; each item is an article list or the
+            exception raised for that symbol
+        """
+        # One date window for the whole batch
+        from_date, to_date = news_date_range(days_back)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(client, symbol):
+            async with semaphore:
+                return await self.get_company_news_async(client, symbol, from_date, to_date)
+
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+            ),
+        ) as client:
+            return await asyncio.gather(
+                *(fetch(client, symbol) for symbol in symbols),
+                return_exceptions=True,
+            )
+
     def get_quote(self, symbol):
         """
         Get real-time quote for a symbol.
@@ -171,8 +280,9 @@ class FinnhubClient:
         if not data:
             return []
 
+        # Most recent first, formatting only the items returned
         articles = []
-        for item in data[:limit]:
+        for item in heapq.nlargest(limit, data, key=lambda i: i.get('datetime', 0)):
             articles.append({
                 'headline': item.get('headline', 'No headline'),
                 'summary': item.get('summary', ''),
@@ -186,8 +296,70 @@ class FinnhubClient:
         return articles
 
 
+def _retry_after(response, default):
+    """Seconds to wait before retrying, from a Retry-After header if present."""
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return default
+
+
+def news_date_range(days_back=7):
+    """
+    Date window for company news ending today.
+
+    Computed once per batch and passed to get_company_news, so cache keys
+    are plain dates and stay stable for the whole day.
+
+    Args:
+        days_back: Number of days to look back (default 7)
+
+    Returns:
+        Tuple of ('YYYY-MM-DD' from date, 'YYYY-MM-DD' to date)
+    """
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days_back)
+    return start_date.isoformat(), end_date.isoformat()
+
+
+def _company_news_params(symbol, from_date, to_date):
+    """Query parameters for the company-news endpoint."""
+    return {
+        'symbol': symbol.upper(),
+        'from': from_date,
+        'to': to_date
+    }
+
+
+def _parse_company_news(data):
+    """Format raw company-news items, most recent first."""
+    if not data:
+        return []
+
+    # Select the 10 most recent items, newest first, before formatting
+    articles = []
+    for item in heapq.nlargest(10, data, key=lambda i: i.get('datetime', 0)):
+        articles.append({
+            'headline': item.get('headline', 'No headline'),
+            'summary': item.get('summary', ''),
+            'source': item.get('source', 'Unknown'),
+            'url': item.get('url', ''),
+            'datetime': datetime.fromtimestamp(item.get('datetime', 0)),
+            'category': item.get('category', ''),
+            'related': item.get('related', '')
+        })
+
+    return articles
+
+
 # Convenience functions for quick access
 
+@lru_cache(maxsize=1)
+def _default_client():
+    """Shared FinnhubClient for the convenience functions."""
+    return FinnhubClient()
+
+
 def get_latest_news(symbol, limit=5):
     """
     Get the most recent news for a symbol.
@@ -199,8 +371,8 @@ def get_latest_news(symbol, limit=5):
     Returns:
         List of news articles, most recent first
     """
-    client = FinnhubClient()
-    articles = client.get_company_news(symbol, days_back=7)
+    client = _default_client()
+    articles = client.get_company_news(symbol, *news_date_range(days_back=7))
     return articles[:limit]
 
 
@@ -215,6 +387,28 @@ def get_top_news_article(symbol):
     return articles[0] if articles else None
 
 
+def get_top_news_articles(symbols):
+    """
+    Get the top news article for many symbols in one concurrent batch.
+
+    Args:
+        symbols: List of ticker symbols
+
+    Returns:
+        Dict mapping symbol to (article or None, exception or None)
+    """
+    results = asyncio.run(_default_client().fetch_news_bulk(symbols))
+
+    news_map = {}
+    for symbol, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            logger.warning(f"News fetch failed for {symbol}: {result}")
+            news_map[symbol] = (None, result)
+        else:
+            news_map[symbol] = (result[0] if result else None, None)
+    return news_map
+
+
 def format_news_for_display(article):
     """
     Format a news article for display in the UI.
@@ -0,0 +1,54 @@
+"""
+Shared HTTP session for external market data APIs.
+
+A single pooled requests.Session keeps TCP/TLS connections alive across
+calls (gainers/losers/actives, per-symbol news), instead of a new handshake
+for every bare requests.get(). Session is safe to share across threads for
+simple GET requests.
+
+Usage:
+    from strategies.http_session import http_session
+
+    response = http_session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept per host; sized for the concurrent news fetch
+POOL_SIZE = 20
+
+# (connect, read) seconds; a slow host fails fast instead of stalling a scan
+REQUEST_TIMEOUT = (3, 7)
+
+
+def build_session(pool_size=POOL_SIZE):
+    """
+    Create a requests.Session with a connection pool and retry policy.
+
+    Transient rate limiting and server errors on GET requests are retried
+    twice with backoff.
+
+    Args:
+        pool_size: Connections kept alive per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+        ),
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+http_session = build_session()
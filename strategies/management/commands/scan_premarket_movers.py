@@ -17,7 +17,6 @@ from strategies.models import PreMarketMover
 from strategies.watchlists import get_watchlist, combine_watchlists
 from strategies.market_universe import get_market_universe
 from strategies.stock_data import get_top_movers
-from strategies.finnhub_service import get_top_news_article
 import logging
 
 logger = logging.getLogger(__name__)
@@ -145,7 +144,39 @@ class Command(BaseCommand):
             ))
             return
 
-        # Process each mover
+        # Look up movers already tracked today in one query
+        today = timezone.now().date()
+        existing_ids = dict(
+            PreMarketMover.objects.filter(
+                symbol__in=[m.symbol for m in filtered_movers],
+                identified_date__date=today
+            ).values_list('symbol', 'id')
+        )
+
+        # Fetch news up front for the movers that will be created: one FMP
+        # multi-ticker request, then one Finnhub batch for symbols it missed
+        news_map = {}
+        if not skip_news:
+            # Imported here so --skip-news runs don't load the news stack
+            # (httpx, asyncio) at all
+            from strategies.discovery_apis import get_news_batch
+            from strategies.finnhub_service import get_top_news_articles
+
+            symbols_needing_news = [
+                m.symbol for m in filtered_movers if m.symbol not in existing_ids
+            ]
+            if symbols_needing_news:
+                self.stdout.write(f'Fetching news for {len(symbols_needing_news)} movers...')
+                news_map = {
+                    symbol: (article, None)
+                    for symbol, article in get_news_batch(symbols_needing_news).items()
+                }
+                missing = [s for s in symbols_needing_news if s not in news_map]
+                if missing:
+                    news_map.update(get_top_news_articles(missing))
+
+        # Process each mover; new records are collected and inserted together
+        to_create = []
         created_count = 0
         skipped_count = 0
 
@@ -169,15 +200,11 @@ class Command(BaseCommand):
                 self.stdout.write(f'   Spread: {spread:.3f}% {spread_indicator}')
 
             # Check if already tracked today
-            today = timezone.now().date()
-            existing = PreMarketMover.objects.filter(
-                symbol=symbol,
-                identified_date__date=today
-            ).first()
+            existing_id = existing_ids.get(symbol)
 
-            if existing:
+            if existing_id:
                 self.stdout.write(self.style.WARNING(
-                    f'   ⚠️  Already tracked today (ID: {existing.id}) - SKIPPED'
+                    f'   ⚠️  Already tracked today (ID: {existing_id}) - SKIPPED'
                 ))
                 skipped_count += 1
                 continue
@@ -188,49 +215,49 @@ class Command(BaseCommand):
             news_url = ''
 
             if not skip_news:
-                self.stdout.write('   Fetching news from Finnhub...')
-                try:
-                    article = get_top_news_article(symbol)
-                    if article:
-                        news_headline = article['headline']
-                        news_source = article['source']
-                        news_url = article['url']
-                        self.stdout.write(f'   📰 {news_headline[:60]}...')
-                    else:
-                        self.stdout.write(self.style.WARNING('   ⚠️  No news found'))
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f'   ⚠️  News fetch failed: {e}'))
-                    logger.warning(f'News fetch failed for {symbol}: {e}')
-
-            # Create record
+                article, error = news_map.get(symbol, (None, None))
+                if error:
+                    self.stdout.write(self.style.WARNING(f'   ⚠️  News fetch failed: {error}'))
+                elif article:
+                    news_headline = article['headline']
+                    news_source = article['source']
+                    news_url = article['url']
+                    self.stdout.write(f'   📰 {news_headline[:60]}...')
+                else:
+                    self.stdout.write(self.style.WARNING('   ⚠️  No news found'))
+
+            # Queue record
             if not dry_run:
-                try:
-                    new_mover = PreMarketMover.objects.create(
-                        symbol=symbol,
-                        company_name=company_name,
-                        news_headline=news_headline,
-                        news_source=news_source,
-                        news_url=news_url,
-                        movement_percent=movement,
-                        pre_market_price=price,
-                        # Phase 1: Volume Metrics
-                        pre_market_volume=mover.pre_market_volume,
-                        average_volume=mover.average_volume,
-                        relative_volume_ratio=mover.relative_volume_ratio,
-                        spread_percent=mover.spread_percent,
-                        status='identified'
-                    )
-                    self.stdout.write(self.style.SUCCESS(
-                        f'   ✅ Tracked (ID: {new_mover.id})'
-                    ))
-                    created_count += 1
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f'   ❌ Failed to create: {e}'))
-                    logger.error(f'Failed to create mover for {symbol}: {e}')
+                to_create.append(PreMarketMover(
+                    symbol=symbol,
+                    company_name=company_name,
+                    news_headline=news_headline,
+                    news_source=news_source,
+                    news_url=news_url,
+                    movement_percent=movement,
+                    pre_market_price=price,
+                    # Phase 1: Volume Metrics
+                    pre_market_volume=mover.pre_market_volume,
+                    average_volume=mover.average_volume,
+                    relative_volume_ratio=mover.relative_volume_ratio,
+                    spread_percent=mover.spread_percent,
+                    status='identified'
+                ))
             else:
                 self.stdout.write(self.style.SUCCESS('   ✅ Would create (DRY RUN)'))
                 created_count += 1
 
+        # Create all new records in a single INSERT
+        if to_create:
+            try:
+                new_movers = PreMarketMover.objects.bulk_create(to_create, batch_size=500)
+                created_count = len(new_movers)
+                tracked = ', '.join(f'{m.symbol} (ID: {m.id})' for m in new_movers)
+                self.stdout.write(self.style.SUCCESS(f'\n✅ Tracked: {tracked}'))
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'\n❌ Failed to create movers: {e}'))
+                logger.error(f'Failed to create movers: {e}')
+
         # Summary
         self.stdout.write(
             f'\n{"="*60}\n'
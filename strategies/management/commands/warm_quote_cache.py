@@ -0,0 +1,103 @@
+"""
+Django Management Command: Warm Quote Cache
+
+Keeps a watchlist's batched quotes in the shared cache so scans and page
+loads are served without waiting on Yahoo. Run it as a single long-lived
+process next to the web workers; a cache lock makes any extra copies exit.
+
+Usage:
+    python manage.py warm_quote_cache
+    python manage.py warm_quote_cache --watchlist aggressive
+    python manage.py warm_quote_cache --once
+"""
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from strategies.watchlists import get_watchlist
+from strategies.stock_data import quote_ttl, warm_quote_cache
+import logging
+import os
+import socket
+import time
+
+logger = logging.getLogger(__name__)
+
+# Held by the running warmer; expires if it dies without releasing it
+LEADER_KEY = 'quote_warmup:leader'
+
+
+class Command(BaseCommand):
+    help = "Keep a watchlist's quotes warm in the shared cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--watchlist',
+            type=str,
+            default='default',
+            help='Watchlist to keep warm (default, aggressive, conservative, meme, earnings)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Warm the cache once and exit (e.g. from cron)'
+        )
+
+    def handle(self, *args, **options):
+        symbols = get_watchlist(options['watchlist'])
+
+        if options['once']:
+            warm_quote_cache(symbols)
+            self.stdout.write(self.style.SUCCESS(f'Warmed quotes for {len(symbols)} symbols'))
+            return
+
+        # Only one warmer refreshes at a time, whatever number are started.
+        # The lock value identifies the holder so it only renews and releases
+        # its own lock
+        owner = f'{socket.gethostname()}:{os.getpid()}'
+        if not cache.add(LEADER_KEY, owner, 2 * quote_ttl()):
+            self.stdout.write(self.style.WARNING('Another quote warmer is running, exiting'))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Keeping quotes warm for {len(symbols)} symbols (watchlist: {options["watchlist"]})'
+        ))
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    warm_quote_cache(symbols)
+                except Exception as e:
+                    logger.warning(f"Quote warm-up failed: {e}")
+                pass_seconds = time.monotonic() - started
+
+                # Refresh every half TTL, so entries are replaced before they
+                # expire. The lease covers two full cycles at the measured
+                # pass time, so a slow pass doesn't hand the lock to another
+                # warmer while this one is still running
+                ttl = quote_ttl()
+                interval = ttl / 2
+                lease = max(2 * ttl, 2 * (pass_seconds + interval))
+                if not _renew_lease(owner, lease):
+                    self.stdout.write(self.style.WARNING('Lost the quote warmer lock, exiting'))
+                    return
+                time.sleep(interval)
+        finally:
+            if cache.get(LEADER_KEY) == owner:
+                cache.delete(LEADER_KEY)
+
+
+def _renew_lease(owner, lease):
+    """
+    Extend the leader lock if this warmer still holds it.
+
+    Returns:
+        False if another warmer took the lock over
+    """
+    holder = cache.get(LEADER_KEY)
+    if holder is None:
+        # Expired during a slow pass and nobody else took it
+        return cache.add(LEADER_KEY, owner, lease)
+    if holder != owner:
+        return False
+    cache.set(LEADER_KEY, owner, lease)
+    return True
@@ -13,20 +13,40 @@ Phase 3 Enhancements:
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
 import logging
 import yfinance as yf
+from yfinance.data import YfData
+from yfinance.exceptions import YFException
 
 # Wave 1 infrastructure
 from .cache_utils import cached
 from .rate_limiter import yfinance_limiter
 from .api_monitoring import yfinance_monitor
-from time import time
+from time import monotonic
 
 logger = logging.getLogger(__name__)
 
+# Yahoo's multi-symbol quote endpoint (accepts up to ~10 symbols per call)
+QUOTE_URL = 'https://query1.finance.yahoo.com/v7/finance/quote'
 
-@dataclass
+# Indices, volatility and index futures shown in the market context widget
+MARKET_SYMBOLS = ['SPY', 'QQQ', '^VIX', 'ES=F', 'NQ=F']
+
+# Longest wait for the concurrent per-symbol fallback
+FALLBACK_TIMEOUT_SECONDS = 5
+
+# Network (requests/curl), timeout, parse and yfinance errors for one fetch
+QUOTE_ERRORS = (KeyError, ValueError, OSError, YFException)
+
+# Per-process copy of the latest context, checked before the shared cache;
+# swapped as one (value, expiry) tuple so readers never see a torn pair
+LOCAL_TTL_SECONDS = 5
+_local_context = (None, 0.0)
+
+
+@dataclass(slots=True, frozen=True)
 class MarketContext:
     """
     Snapshot of overall market conditions.
@@ -63,131 +83,221 @@ class MarketContext:
         """
         return self.spy_change < -0.5 and self.vix_level > 25
 
+    # Badge color and emoji per sentiment; anything else is neutral
+    _SENTIMENT_COLORS = {'bullish': 'green', 'bearish': 'red'}
+    _SENTIMENT_EMOJIS = {'bullish': '✅', 'bearish': '⚠️'}
+
     @property
     def sentiment_color(self) -> str:
         """Get Tailwind color class for sentiment badge"""
-        if self.market_sentiment == 'bullish':
-            return 'green'
-        elif self.market_sentiment == 'bearish':
-            return 'red'
-        else:
-            return 'gray'
+        return self._SENTIMENT_COLORS.get(self.market_sentiment, 'gray')
 
     @property
     def sentiment_emoji(self) -> str:
         """Get emoji for sentiment display"""
-        if self.market_sentiment == 'bullish':
-            return '✅'
-        elif self.market_sentiment == 'bearish':
-            return '⚠️'
-        else:
-            return '➖'
+        return self._SENTIMENT_EMOJIS.get(self.market_sentiment, '➖')
+
+    # (key, digits) for numeric fields serialized by to_dict; None passes through
+    _ROUNDED_FIELDS = (
+        ('spy_change', 2),
+        ('qqq_change', 2),
+        ('vix_level', 2),
+        ('es_futures', 2),
+        ('nq_futures', 2),
+        ('spy_price', 2),
+        ('qqq_price', 2),
+        ('vix_price', 2),
+    )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
-        return {
-            'spy_change': round(self.spy_change, 2),
-            'qqq_change': round(self.qqq_change, 2),
-            'vix_level': round(self.vix_level, 2),
-            'es_futures': round(self.es_futures, 2) if self.es_futures else None,
-            'nq_futures': round(self.nq_futures, 2) if self.nq_futures else None,
-            'market_sentiment': self.market_sentiment,
-            'last_updated': self.last_updated.strftime('%I:%M %p ET'),
-            'spy_price': round(self.spy_price, 2),
-            'qqq_price': round(self.qqq_price, 2),
-            'vix_price': round(self.vix_price, 2),
-            'is_risk_on': self.is_risk_on,
-            'is_risk_off': self.is_risk_off,
-            'sentiment_color': self.sentiment_color,
-            'sentiment_emoji': self.sentiment_emoji,
+        data = {
+            key: None if (value := getattr(self, key)) is None else round(value, digits)
+            for key, digits in self._ROUNDED_FIELDS
         }
+        data.update(
+            market_sentiment=self.market_sentiment,
+            last_updated=self.last_updated.strftime('%I:%M %p ET'),
+            is_risk_on=self.is_risk_on,
+            is_risk_off=self.is_risk_off,
+            sentiment_color=self.sentiment_color,
+            sentiment_emoji=self.sentiment_emoji,
+        )
+        return data
 
 
-@yfinance_limiter
-@cached(ttl_seconds=60, key_prefix='market_context')
 def get_market_context() -> Optional[MarketContext]:
+    """
+    Get current market conditions, served from cache where possible.
+
+    Two cache tiers sit in front of the API: a per-process copy kept for
+    LOCAL_TTL_SECONDS (no cache round trip for dashboard polling bursts),
+    then the shared Django cache for 1 minute.
+
+    Returns:
+        MarketContext object or None if fetch fails
+    """
+    global _local_context
+
+    context, expires = _local_context
+    if monotonic() < expires:
+        return context
+
+    context = _fetch_market_context()
+    _local_context = (context, monotonic() + LOCAL_TTL_SECONDS)
+    return context
+
+
+@cached(ttl_seconds=60, key_prefix='market_context')
+def _fetch_market_context() -> Optional[MarketContext]:
     """
     Fetch current market conditions with Wave 1 infrastructure.
 
     Cached for 1 minute to reduce API calls while maintaining freshness.
-    Rate limited and monitored for reliability.
+    Each upstream request is rate limited and the fetch is monitored.
 
     Returns:
         MarketContext object or None if fetch fails
     """
-    start_time = time()
-
     try:
-        # Fetch major indices
-        spy = yf.Ticker('SPY').info
-        qqq = yf.Ticker('QQQ').info
-        vix = yf.Ticker('^VIX').info
+        with yfinance_monitor.record():
+            # Fetch indices and futures in a single quote request
+            quotes = _fetch_quotes(MARKET_SYMBOLS)
+            spy = quotes.get('SPY', {})
+            qqq = quotes.get('QQQ', {})
+            vix = quotes.get('^VIX', {})
+
+            # Calculate percentage changes
+            spy_current = spy.get('regularMarketPrice')
+            spy_prev = spy.get('regularMarketPreviousClose')
+            qqq_current = qqq.get('regularMarketPrice')
+            qqq_prev = qqq.get('regularMarketPreviousClose')
+            vix_current = vix.get('regularMarketPrice')
+
+            if not all([spy_current, spy_prev, qqq_current, qqq_prev, vix_current]):
+                raise ValueError("Missing required market data from YFinance")
+
+            spy_change = ((spy_current - spy_prev) / spy_prev) * 100
+            qqq_change = ((qqq_current - qqq_prev) / qqq_prev) * 100
+
+            # Futures are optional; missing quotes leave the change as None
+            es_futures_change = _percent_change(quotes.get('ES=F', {}))
+            nq_futures_change = _percent_change(quotes.get('NQ=F', {}))
+            if es_futures_change is None or nq_futures_change is None:
+                logger.warning("Futures quotes unavailable (ES=F/NQ=F)")
+
+            # Determine market sentiment
+            sentiment = determine_sentiment(spy_change, vix_current)
 
-        # Calculate percentage changes
-        spy_current = spy.get('regularMarketPrice') or spy.get('currentPrice')
-        spy_prev = spy.get('previousClose')
-        qqq_current = qqq.get('regularMarketPrice') or qqq.get('currentPrice')
-        qqq_prev = qqq.get('previousClose')
-        vix_current = vix.get('regularMarketPrice') or vix.get('currentPrice')
+    except Exception as e:
+        logger.error(f"Failed to fetch market context: {e}", exc_info=True)
+        return None
 
-        if not all([spy_current, spy_prev, qqq_current, qqq_prev, vix_current]):
-            logger.error("Missing required market data from YFinance")
-            return None
+    logger.info(
+        f"Market context fetched: SPY {spy_change:+.2f}%, "
+        f"QQQ {qqq_change:+.2f}%, VIX {vix_current:.2f}, "
+        f"Sentiment: {sentiment}"
+    )
+
+    return MarketContext(
+        spy_change=spy_change,
+        qqq_change=qqq_change,
+        vix_level=vix_current,
+        es_futures=es_futures_change,
+        nq_futures=nq_futures_change,
+        market_sentiment=sentiment,
+        last_updated=datetime.now(),
+        spy_price=spy_current,
+        qqq_price=qqq_current,
+        vix_price=vix_current,
+    )
+
+
+def _fetch_quotes(symbols: List[str]) -> Dict[str, dict]:
+    """
+    Fetch quotes for several symbols, batched with a concurrent fallback.
 
-        spy_change = ((spy_current - spy_prev) / spy_prev) * 100
-        qqq_change = ((qqq_current - qqq_prev) / qqq_prev) * 100
+    Tries one Yahoo v7 quote request first; if Yahoo rejects it, fetches
+    each symbol's fast_info in parallel so the wait is the slowest single call
+    rather than the sum of all of them.
 
-        # Fetch futures (may fail, so use try/except)
-        es_futures_change = None
-        nq_futures_change = None
+    Args:
+        symbols: Ticker symbols (keep to 10 or fewer)
 
+    Returns:
+        Dict mapping symbol to a quote dict with regularMarketPrice and
+        regularMarketPreviousClose
+    """
+    try:
+        return fetch_quotes_batch(symbols)
+    except QUOTE_ERRORS as e:
+        logger.warning(f"Batched quote request failed, fetching per symbol: {e}")
+
+    # No `with` block: its exit would join every worker, so one hung symbol
+    # would still hold up the response past the fallback timeout
+    executor = ThreadPoolExecutor(max_workers=len(symbols))
+    futures = {symbol: executor.submit(_fetch_quote, symbol) for symbol in symbols}
+    wait(futures.values(), timeout=FALLBACK_TIMEOUT_SECONDS)
+
+    quotes = {}
+    for symbol, future in futures.items():
+        if not future.done():
+            logger.warning(f"Timed out fetching {symbol} quote")
+            continue
         try:
-            es = yf.Ticker('ES=F').info
-            if es.get('regularMarketPrice') and es.get('previousClose'):
-                es_futures_change = ((es['regularMarketPrice'] - es['previousClose']) / es['previousClose']) * 100
-        except Exception as e:
-            logger.warning(f"Could not fetch ES futures: {e}")
+            quotes[symbol] = future.result()
+        except QUOTE_ERRORS as e:
+            logger.warning(f"Could not fetch {symbol} quote: {e}")
 
-        try:
-            nq = yf.Ticker('NQ=F').info
-            if nq.get('regularMarketPrice') and nq.get('previousClose'):
-                nq_futures_change = ((nq['regularMarketPrice'] - nq['previousClose']) / nq['previousClose']) * 100
-        except Exception as e:
-            logger.warning(f"Could not fetch NQ futures: {e}")
-
-        # Determine market sentiment
-        sentiment = determine_sentiment(spy_change, vix_current)
-
-        # Record successful API call
-        latency_ms = int((time() - start_time) * 1000)
-        yfinance_monitor.record_call(success=True, response_code=200, latency_ms=latency_ms)
-
-        logger.info(
-            f"Market context fetched: SPY {spy_change:+.2f}%, "
-            f"QQQ {qqq_change:+.2f}%, VIX {vix_current:.2f}, "
-            f"Sentiment: {sentiment}"
-        )
+    executor.shutdown(wait=False, cancel_futures=True)
+    return quotes
 
-        return MarketContext(
-            spy_change=spy_change,
-            qqq_change=qqq_change,
-            vix_level=vix_current,
-            es_futures=es_futures_change,
-            nq_futures=nq_futures_change,
-            market_sentiment=sentiment,
-            last_updated=datetime.now(),
-            spy_price=spy_current,
-            qqq_price=qqq_current,
-            vix_price=vix_current,
-        )
 
-    except Exception as e:
-        # Record failed API call
-        latency_ms = int((time() - start_time) * 1000)
-        yfinance_monitor.record_call(success=False, response_code=None, latency_ms=latency_ms)
+@yfinance_limiter
+def fetch_quotes_batch(symbols: List[str]) -> Dict[str, dict]:
+    """
+    Fetch quotes for several symbols with one Yahoo v7 quote request.
 
-        logger.error(f"Failed to fetch market context: {e}", exc_info=True)
-        return None
+    Uses yfinance's shared YfData session, which manages the cookie/crumb
+    Yahoo requires, instead of a yf.Ticker(...).info call per symbol (two
+    requests each).
+    """
+    data = YfData().get_raw_json(
+        QUOTE_URL,
+        params={'symbols': ','.join(symbols), 'formatted': 'false'},
+        timeout=10,
+    )
+    results = (data.get('quoteResponse') or {}).get('result') or []
+    return {quote['symbol']: quote for quote in results if 'symbol' in quote}
+
+
+@yfinance_limiter
+def _fetch_quote(symbol: str) -> dict:
+    """
+    Fetch one symbol's quote via yf.Ticker(...).fast_info (fallback path).
+
+    fast_info reads the price pair from a small chart response instead of
+    the full multi-module quoteSummary that .info downloads.
+    """
+    fast_info = yf.Ticker(symbol).fast_info
+    return {
+        'symbol': symbol,
+        'regularMarketPrice': fast_info.last_price,
+        'regularMarketPreviousClose': fast_info.previous_close,
+    }
+
+
+def _percent_change(quote: dict) -> Optional[float]:
+    """Percent change from previous close, or None if either price is missing."""
+    price = quote.get('regularMarketPrice')
+    previous = quote.get('regularMarketPreviousClose')
+    if price and previous:
+        return ((price - previous) / previous) * 100
+    return None
+
+
+# Indexed by bullish * 2 + bearish
+_SENTIMENTS = ('neutral', 'bearish', 'bullish')
 
 
 def determine_sentiment(spy_change: float, vix_level: float) -> str:
@@ -206,12 +316,10 @@ def determine_sentiment(spy_change: float, vix_level: float) -> str:
     Returns:
         'bullish', 'bearish', or 'neutral'
     """
-    if spy_change > 0.5 and vix_level < 18:
-        return 'bullish'
-    elif spy_change < -0.5 or vix_level > 25:
-        return 'bearish'
-    else:
-        return 'neutral'
+    bullish = spy_change > 0.5 and vix_level < 18
+    bearish = spy_change < -0.5 or vix_level > 25
+    # The two conditions are mutually exclusive, so the index is 0, 1 or 2
+    return _SENTIMENTS[bullish * 2 + bearish]
 
 
 def format_percent_change(value: Optional[float]) -> str:
@@ -231,6 +339,14 @@ def format_percent_change(value: Optional[float]) -> str:
     return f"{sign}{value:.2f}%"
 
 
+# Indexed by sign(value) + 1: negative, flat, positive
+_CHANGE_COLOR_CLASSES = (
+    "text-red-600 dark:text-red-400",
+    "text-gray-600 dark:text-gray-400",
+    "text-green-600 dark:text-green-400",
+)
+
+
 def get_change_color_class(value: Optional[float]) -> str:
     """
     Get Tailwind color class based on positive/negative change.
@@ -243,9 +359,4 @@ def get_change_color_class(value: Optional[float]) -> str:
     """
     if value is None:
         return "text-gray-500"
-    elif value > 0:
-        return "text-green-600 dark:text-green-400"
-    elif value < 0:
-        return "text-red-600 dark:text-red-400"
-    else:
-        return "text-gray-600 dark:text-gray-400"
+    return _CHANGE_COLOR_CLASSES[(value > 0) - (value < 0) + 1]
@@ -3,6 +3,11 @@ Market Universe - Comprehensive Stock Lists
 
 Pre-built lists of stocks to scan for market-wide discovery.
 These replace the need for a market screener API.
+
+The larger universes are meant to be fetched in batches, not one symbol
+at a time: use strategies.stock_data.get_stock_data (Yahoo, 10 symbols per
+request, several in flight, cached per chunk) or
+strategies.discovery_apis.get_quotes_bulk (FMP) rather than a yf.Ticker loop.
 """
 
 # S&P 500 - Top 100 most liquid (full list is too slow for real-time scanning)
@@ -200,6 +205,77 @@ ENERGY_EXTENDED = [
 ]
 
 
+# Combined universes for discovery, deduplicated once at import time.
+# dict.fromkeys keeps first-seen order, so scans run in a stable order.
+_COMPREHENSIVE = tuple(dict.fromkeys(
+    SP500_TOP_100 + SP500_NEXT_100 +  # S&P 500 top 200
+    NASDAQ_100 +  # NASDAQ 100
+    ETFS +  # Popular ETFs
+    RETAIL_FAVORITES +  # Meme stocks
+    RECENT_IPOS +  # Recent IPOs
+    HIGH_SHORT_INTEREST +  # Squeeze candidates
+    SEMICONDUCTOR +  # Chip stocks
+    BIOTECH_MOVERS +  # Biotech
+    CLOUD_SAAS +  # Cloud/SaaS
+    FINTECH +  # Fintech
+    CHINESE_ADRS  # Chinese ADRs
+))
+
+_ALL = tuple(dict.fromkeys(
+    SP500_TOP_100 + SP500_NEXT_100 +
+    NASDAQ_100 +
+    ETFS +
+    RETAIL_FAVORITES +
+    RECENT_IPOS +
+    HIGH_SHORT_INTEREST +
+    CHINESE_ADRS +
+    BIOTECH_MOVERS +
+    SEMICONDUCTOR +
+    EV_AUTO +
+    CRYPTO_EXPOSED +
+    DEFENSE +
+    CLOUD_SAAS +
+    FINTECH +
+    GAMING +
+    ECOMMERCE +
+    ENERGY_EXTENDED +
+    RUSSELL_2000_LIQUID
+))
+
+# Universe name -> symbols; tuples so callers can't mutate the shared lists
+_UNIVERSES = {
+    # Single categories
+    'sp500': tuple(SP500_TOP_100),
+    'sp500_extended': tuple(dict.fromkeys(SP500_TOP_100 + SP500_NEXT_100)),
+    'nasdaq': tuple(NASDAQ_100),
+    'retail': tuple(RETAIL_FAVORITES),
+    'etfs': tuple(ETFS),
+    'ipos': tuple(RECENT_IPOS),
+    'short': tuple(HIGH_SHORT_INTEREST),
+
+    # Sector-specific
+    'chinese': tuple(CHINESE_ADRS),
+    'biotech': tuple(BIOTECH_MOVERS),
+    'semiconductor': tuple(SEMICONDUCTOR),
+    'ev': tuple(EV_AUTO),
+    'crypto': tuple(CRYPTO_EXPOSED),
+    'defense': tuple(DEFENSE),
+    'cloud': tuple(CLOUD_SAAS),
+    'fintech': tuple(FINTECH),
+    'gaming': tuple(GAMING),
+    'ecommerce': tuple(ECOMMERCE),
+    'energy': tuple(ENERGY_EXTENDED),
+    'smallcap': tuple(RUSSELL_2000_LIQUID),
+
+    # Combined universes for discovery
+    'comprehensive': _COMPREHENSIVE,
+    'all': _ALL,
+}
+
+# Frozen sets of the same universes for O(1) membership checks
+_UNIVERSE_SETS = {name: frozenset(symbols) for name, symbols in _UNIVERSES.items()}
+
+
 def get_market_universe(name='comprehensive'):
     """
     Get a comprehensive list of stocks to scan for market-wide discovery.
@@ -217,70 +293,22 @@ def get_market_universe(name='comprehensive'):
             - Sector-specific: biotech, semiconductor, ev, crypto, defense, cloud, fintech, gaming, ecommerce, energy
 
     Returns:
-        List of stock symbols (deduplicated)
+        Tuple of stock symbols (deduplicated, precomputed at import)
+    """
+    return _UNIVERSES.get(name.lower(), _COMPREHENSIVE)
+
+
+def get_market_universe_set(name='comprehensive'):
+    """
+    Get a universe as a frozenset, for checking whether symbols belong to it.
+
+    Args:
+        name: Universe name (see get_market_universe)
+
+    Returns:
+        Frozenset of stock symbols
     """
-    universes = {
-        # Single categories
-        'sp500': SP500_TOP_100,
-        'sp500_extended': SP500_TOP_100 + SP500_NEXT_100,
-        'nasdaq': NASDAQ_100,
-        'retail': RETAIL_FAVORITES,
-        'etfs': ETFS,
-        'ipos': RECENT_IPOS,
-        'short': HIGH_SHORT_INTEREST,
-
-        # Sector-specific
-        'chinese': CHINESE_ADRS,
-        'biotech': BIOTECH_MOVERS,
-        'semiconductor': SEMICONDUCTOR,
-        'ev': EV_AUTO,
-        'crypto': CRYPTO_EXPOSED,
-        'defense': DEFENSE,
-        'cloud': CLOUD_SAAS,
-        'fintech': FINTECH,
-        'gaming': GAMING,
-        'ecommerce': ECOMMERCE,
-        'energy': ENERGY_EXTENDED,
-        'smallcap': RUSSELL_2000_LIQUID,
-
-        # Combined universes for discovery
-        'comprehensive': list(set(
-            SP500_TOP_100 + SP500_NEXT_100 +  # S&P 500 top 200
-            NASDAQ_100 +  # NASDAQ 100
-            ETFS +  # Popular ETFs
-            RETAIL_FAVORITES +  # Meme stocks
-            RECENT_IPOS +  # Recent IPOs
-            HIGH_SHORT_INTEREST +  # Squeeze candidates
-            SEMICONDUCTOR +  # Chip stocks
-            BIOTECH_MOVERS +  # Biotech
-            CLOUD_SAAS +  # Cloud/SaaS
-            FINTECH +  # Fintech
-            CHINESE_ADRS  # Chinese ADRs
-        )),
-
-        'all': list(set(
-            SP500_TOP_100 + SP500_NEXT_100 +
-            NASDAQ_100 +
-            ETFS +
-            RETAIL_FAVORITES +
-            RECENT_IPOS +
-            HIGH_SHORT_INTEREST +
-            CHINESE_ADRS +
-            BIOTECH_MOVERS +
-            SEMICONDUCTOR +
-            EV_AUTO +
-            CRYPTO_EXPOSED +
-            DEFENSE +
-            CLOUD_SAAS +
-            FINTECH +
-            GAMING +
-            ECOMMERCE +
-            ENERGY_EXTENDED +
-            RUSSELL_2000_LIQUID
-        )),
-    }
-
-    return universes.get(name.lower(), universes['comprehensive'])
+    return _UNIVERSE_SETS.get(name.lower(), _UNIVERSE_SETS['comprehensive'])
 
 
 def get_universe_info():
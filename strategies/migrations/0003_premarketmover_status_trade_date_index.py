@@ -0,0 +1,32 @@
+# Generated by Django 5.0.14 on 2026-10-15 16:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("strategies", "0002_add_volume_metrics"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="premarketmover",
+            name="strategies__status_3f9742_idx",
+        ),
+        migrations.AlterField(
+            model_name="premarketmover",
+            name="average_volume",
+            field=models.BigIntegerField(
+                blank=True,
+                help_text="3-month average volume (from yfinance)",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="premarketmover",
+            index=models.Index(
+                fields=["status", "trade_date"], name="strategies__status_0132ee_idx"
+            ),
+        ),
+    ]
@@ -51,16 +51,23 @@ class PreMarketMover(models.Model):
         ordering = ['-identified_date']
         indexes = [
             models.Index(fields=['-identified_date']),
-            models.Index(fields=['status']),
+            models.Index(fields=['status', 'trade_date']),
             models.Index(fields=['trade_date']),
         ]
 
     def __str__(self):
         return f"{self.symbol} - {self.trade_date} ({self.get_status_display()})"
 
-    def calculate_profit_loss(self):
-        """Calculate profit/loss if both entry and exit prices exist"""
+    def calculate_profit_loss(self, save=True):
+        """
+        Calculate profit/loss if both entry and exit prices exist
+
+        Args:
+            save: Persist just the profit_loss column (saved rows only); pass
+                False when the caller saves the whole row anyway
+        """
         if self.entry_price and self.exit_price:
             self.profit_loss = self.exit_price - self.entry_price
-            self.save()
+            if save and self.pk:
+                self.save(update_fields=['profit_loss'])
         return self.profit_loss
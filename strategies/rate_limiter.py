@@ -14,14 +14,29 @@ Usage:
 """
 
 from functools import wraps
-from time import sleep, time
+from time import monotonic, sleep, time
 from threading import Lock
 import logging
+import uuid
 from django.conf import settings
 from django.core.cache import cache
+from .cache_utils import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Atomically trim the window, then either claim a slot (returns {}) or
+# return the oldest call as {member, score} so the caller knows how long
+# to wait. ARGV: window start, now, max calls, key TTL, member id.
+ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+    return redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return {}
+"""
+
 
 class RateLimiter:
     """
@@ -37,28 +52,30 @@ class RateLimiter:
     def __init__(self, calls_per_second=5):
         self.rate = calls_per_second
         self.tokens = calls_per_second
-        self.last_update = time()
+        # Monotonic clock: refill math must not jump with NTP/wall-clock changes
+        self.last_update = monotonic()
         self.lock = Lock()
 
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             with self.lock:
-                now = time()
+                now = monotonic()
                 elapsed = now - self.last_update
 
                 # Refill tokens based on elapsed time
                 self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
                 self.last_update = now
 
-                # Wait if no tokens available
-                if self.tokens < 1:
-                    wait_time = (1 - self.tokens) / self.rate
-                    logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {func.__name__}")
-                    sleep(wait_time)
-                    self.tokens = 0
-                else:
-                    self.tokens -= 1
+                # Take a token; a negative balance reserves a future slot, so
+                # each waiting caller gets its own wake-up time
+                self.tokens -= 1
+                wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+
+            # Sleep outside the lock so other callers can reserve meanwhile
+            if wait_time > 0:
+                logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {func.__name__}")
+                sleep(wait_time)
 
             return func(*args, **kwargs)
         return wrapper
@@ -71,6 +88,11 @@ class RedisRateLimiter:
     Coordinates rate limiting across multiple processes/workers/machines.
     Suitable for production deployments with Gunicorn/multiple workers.
 
+    With django-redis each function's window is a Redis sorted set of call
+    timestamps, trimmed, counted and appended by one Lua script so
+    concurrent workers can't both claim the last slot. Other cache backends
+    fall back to a cached list of timestamps.
+
     Args:
         calls_per_second: Maximum number of calls per second (default 5)
         window_seconds: Time window for rate limiting (default 1)
@@ -79,43 +101,19 @@ class RedisRateLimiter:
     def __init__(self, calls_per_second=5, window_seconds=1):
         self.calls_per_second = calls_per_second
         self.window_seconds = window_seconds
+        self._script = None
 
     def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             key = f"rate_limit:{func.__name__}"
-            now = time()
 
             try:
-                # Get current call history from Redis
-                cache_data = cache.get(key, {'calls': [], 'last_check': now})
-
-                # Remove calls outside the sliding window
-                cache_data['calls'] = [
-                    call_time for call_time in cache_data['calls']
-                    if now - call_time < self.window_seconds
-                ]
-
-                # Check if we've exceeded the rate limit
-                if len(cache_data['calls']) >= self.calls_per_second:
-                    oldest_call = min(cache_data['calls'])
-                    sleep_time = self.window_seconds - (now - oldest_call)
-
-                    if sleep_time > 0:
-                        logger.debug(
-                            f"Rate limit (Redis): waiting {sleep_time:.2f}s for {func.__name__}"
-                        )
-                        sleep(sleep_time)
-                        now = time()
-                        # Reset window after sleep
-                        cache_data['calls'] = []
-
-                # Record this call
-                cache_data['calls'].append(now)
-                cache_data['last_check'] = now
-
-                # Save to Redis with TTL for auto-cleanup
-                cache.set(key, cache_data, timeout=self.window_seconds * 2)
+                client = get_redis_client()
+                if client is not None:
+                    self._acquire_redis(client, cache.make_key(key), func.__name__)
+                else:
+                    self._acquire_cache(key, func.__name__)
 
             except Exception as e:
                 # If Redis fails, log warning but don't block the call
@@ -127,31 +125,86 @@ class RedisRateLimiter:
             return func(*args, **kwargs)
         return wrapper
 
+    def _acquire_redis(self, client, key, name):
+        """Wait for a slot in the Redis sorted-set window, then claim it."""
+        if self._script is None:
+            self._script = client.register_script(ACQUIRE_SCRIPT)
+
+        member = uuid.uuid4().hex
+        while True:
+            # Wall-clock time: window entries are compared across processes
+            now = time()
+            oldest = self._script(
+                keys=[key],
+                args=[now - self.window_seconds, now, self.calls_per_second,
+                      int(self.window_seconds * 2) or 1, member],
+                client=client,
+            )
+            if not oldest:
+                return
+
+            # Window is full: sleep until its oldest call expires, then retry
+            sleep_time = self.window_seconds - (now - float(oldest[1]))
+            if sleep_time > 0:
+                logger.debug(f"Rate limit (Redis): waiting {sleep_time:.2f}s for {name}")
+                sleep(sleep_time)
+
+    def _acquire_cache(self, key, name):
+        """Sliding window over a cached list of timestamps (non-Redis caches)."""
+        now = time()
+
+        # Get current call history from cache
+        cache_data = cache.get(key, {'calls': [], 'last_check': now})
+
+        # Remove calls outside the sliding window
+        cache_data['calls'] = [
+            call_time for call_time in cache_data['calls']
+            if now - call_time < self.window_seconds
+        ]
+
+        # Check if we've exceeded the rate limit
+        if len(cache_data['calls']) >= self.calls_per_second:
+            oldest_call = min(cache_data['calls'])
+            sleep_time = self.window_seconds - (now - oldest_call)
+
+            if sleep_time > 0:
+                logger.debug(
+                    f"Rate limit (Redis): waiting {sleep_time:.2f}s for {name}"
+                )
+                sleep(sleep_time)
+                now = time()
+                # Reset window after sleep
+                cache_data['calls'] = []
+
+        # Record this call
+        cache_data['calls'].append(now)
+        cache_data['last_check'] = now
+
+        # Save with TTL for auto-cleanup
+        cache.set(key, cache_data, timeout=self.window_seconds * 2)
+
 
 def _get_rate_limiter_class():
     """
     Determine which rate limiter to use based on environment.
 
+    Decided from the configured cache backend rather than a live probe, so
+    importing this module does no I/O and a non-distributed cache (e.g.
+    LocMemCache) is never mistaken for Redis.
+
     Returns:
         RateLimiter (in-memory) for dev, RedisRateLimiter for production
     """
-    # Check if Redis is available and we're not in DEBUG mode
     if settings.DEBUG:
         logger.info("Using in-memory RateLimiter (DEBUG=True)")
         return RateLimiter
 
-    # Test Redis connectivity
-    try:
-        cache.set('_rate_limiter_test', 'test', timeout=1)
-        if cache.get('_rate_limiter_test') == 'test':
-            logger.info("Using RedisRateLimiter (production mode)")
-            cache.delete('_rate_limiter_test')
-            return RedisRateLimiter
-    except Exception as e:
-        logger.warning(
-            f"Redis not available ({e}). Falling back to in-memory RateLimiter"
-        )
+    backend = settings.CACHES['default']['BACKEND']
+    if 'redis' in backend.lower():
+        logger.info(f"Using RedisRateLimiter (cache backend: {backend})")
+        return RedisRateLimiter
 
+    logger.info(f"Using in-memory RateLimiter (cache backend: {backend})")
     return RateLimiter
 
 
@@ -5,47 +5,95 @@ Provides functions for fetching real-time and pre-market stock data.
 
 Phase 3 Enhancements:
 - Rate limiting to prevent "Too Many Requests" errors
-- Caching with 5-minute TTL to reduce API calls
+- Caching (30s TTL while the market trades, 5 minutes when closed)
 - API call monitoring for health metrics
 """
+from django.conf import settings
 import yfinance as yf
 import logging
-import requests
 from typing import Dict, List, Optional
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import math
+from functools import lru_cache
 from time import time
-from datetime import datetime
+from datetime import datetime, time as dtime
 from zoneinfo import ZoneInfo
 
 # Phase 3: Import infrastructure utilities
 from .rate_limiter import yfinance_limiter
 from .cache_utils import cached
 from .api_monitoring import yfinance_monitor
+from .discovery_apis import get_quotes_bulk
+from .market_context import fetch_quotes_batch
 
 logger = logging.getLogger(__name__)
 
+# Symbols fetched concurrently by get_stock_data (yfinance_limiter still
+# caps the request rate across all of them)
+MAX_FETCH_WORKERS = 8
 
-def is_market_hours() -> bool:
+# Symbols per Yahoo v7 quote request in get_stock_data
+QUOTE_CHUNK_SIZE = 10
+
+# US market timezone and session boundaries (ET wall-clock times)
+_ET = ZoneInfo('America/New_York')
+PRE_MARKET_OPEN = dtime(4, 0)
+MARKET_OPEN = dtime(9, 30)
+MARKET_CLOSE = dtime(16, 0)
+AFTER_HOURS_CLOSE = dtime(20, 0)
+
+# Quote cache TTLs: short while any session is trading, longer when closed
+QUOTE_TTL_TRADING = 30
+QUOTE_TTL_CLOSED = 300
+
+
+def market_session() -> str:
     """
-    Check if US stock market is currently open (9:30 AM - 4:00 PM ET).
+    Get the current US market session.
 
-    Uses ET timezone to ensure accurate detection regardless of server location.
-    Excludes weekends.
+    The answer is memoized per wall-clock second, so the views, template
+    filters and cache TTLs that ask several times per request share one
+    timezone conversion.
 
     Returns:
-        True if market is open, False otherwise
+        'pre' (4:00 AM - 9:30 AM ET), 'regular' (9:30 AM - 4:00 PM ET),
+        'after' (4:00 PM - 8:00 PM ET) or 'closed' (overnight and weekends)
     """
-    now_et = datetime.now(ZoneInfo('America/New_York'))
+    return _session_at(int(time()))
+
+
+@lru_cache(maxsize=1)
+def _session_at(timestamp: int) -> str:
+    """Market session at a Unix timestamp (see market_session)."""
+    now_et = datetime.fromtimestamp(timestamp, _ET)
 
     # Check if weekend
     if now_et.weekday() >= 5:  # Saturday = 5, Sunday = 6
-        return False
+        return 'closed'
 
-    # Market hours: 9:30 AM - 4:00 PM ET
-    market_open = now_et.replace(hour=9, minute=30, second=0, microsecond=0)
-    market_close = now_et.replace(hour=16, minute=0, second=0, microsecond=0)
+    now = now_et.time()
+    if PRE_MARKET_OPEN <= now < MARKET_OPEN:
+        return 'pre'
+    if MARKET_OPEN <= now <= MARKET_CLOSE:
+        return 'regular'
+    if MARKET_CLOSE < now <= AFTER_HOURS_CLOSE:
+        return 'after'
+    return 'closed'
 
-    return market_open <= now_et <= market_close
+
+def is_market_hours() -> bool:
+    """
+    Check if US stock market is currently open (9:30 AM - 4:00 PM ET).
+
+    Uses ET timezone to ensure accurate detection regardless of server location.
+    Excludes weekends.
+
+    Returns:
+        True if market is open, False otherwise
+    """
+    return market_session() == 'regular'
 
 
 def is_pre_market_hours() -> bool:
@@ -58,17 +106,7 @@ def is_pre_market_hours() -> bool:
     Returns:
         True if in pre-market session, False otherwise
     """
-    now_et = datetime.now(ZoneInfo('America/New_York'))
-
-    # Check if weekend
-    if now_et.weekday() >= 5:  # Saturday = 5, Sunday = 6
-        return False
-
-    # Pre-market hours: 4:00 AM - 9:30 AM ET
-    pre_market_start = now_et.replace(hour=4, minute=0, second=0, microsecond=0)
-    pre_market_end = now_et.replace(hour=9, minute=30, second=0, microsecond=0)
-
-    return pre_market_start <= now_et < pre_market_end
+    return market_session() == 'pre'
 
 
 def is_after_hours() -> bool:
@@ -81,21 +119,19 @@ def is_after_hours() -> bool:
     Returns:
         True if in after-hours session, False otherwise
     """
-    now_et = datetime.now(ZoneInfo('America/New_York'))
-
-    # Check if weekend
-    if now_et.weekday() >= 5:  # Saturday = 5, Sunday = 6
-        return False
-
-    # After-hours: 4:00 PM - 8:00 PM ET
-    after_hours_start = now_et.replace(hour=16, minute=0, second=0, microsecond=0)
-    after_hours_end = now_et.replace(hour=20, minute=0, second=0, microsecond=0)
-
-    return after_hours_start <= now_et <= after_hours_end
+    return market_session() == 'after'
 
 
 class StockData:
     """Stock market data for a single symbol"""
+    __slots__ = (
+        'symbol', 'company_name', 'current_price', 'previous_close',
+        'pre_market_price', 'pre_market_change_percent', 'regular_market_volume',
+        'pre_market_volume', 'market_cap', 'average_volume', 'bid', 'ask',
+        # Derived values, computed once in __init__ (read via the properties)
+        '_display_price', '_change_percent', '_relative_volume_ratio', '_spread_percent',
+    )
+
     def __init__(self, symbol: str, data: Dict):
         self.symbol = symbol
         self.company_name = data.get('longName', '')
@@ -103,8 +139,8 @@ class StockData:
         self.previous_close = data.get('previousClose')
         self.pre_market_price = data.get('preMarketPrice')
         self.pre_market_change_percent = data.get('preMarketChangePercent')
-        self.regular_market_volume = data.get('regularMarketVolume', 0)
-        self.pre_market_volume = data.get('preMarketVolume', 0)
+        self.regular_market_volume = data.get('regularMarketVolume') or 0
+        self.pre_market_volume = data.get('preMarketVolume') or 0
         self.market_cap = data.get('marketCap')
 
         # Phase 1: Volume Metrics
@@ -112,6 +148,28 @@ class StockData:
         self.bid = data.get('bid')
         self.ask = data.get('ask')
 
+        # Derived values are read many times (sorting, filtering, to_dict),
+        # so compute them once here
+        self._display_price = self.pre_market_price or self.current_price
+
+        price, previous_close = self._display_price, self.previous_close
+        self._change_percent = (
+            ((price - previous_close) / previous_close) * 100
+            if price and previous_close else None
+        )
+
+        self._relative_volume_ratio = None
+        if self.average_volume and self.average_volume > 0:
+            current_vol = self.pre_market_volume if self.pre_market_volume > 0 else self.regular_market_volume
+            if current_vol > 0:
+                self._relative_volume_ratio = current_vol / self.average_volume
+
+        self._spread_percent = None
+        if self.bid and self.ask and self.bid > 0:
+            mid_price = (self.bid + self.ask) / 2
+            if mid_price > 0:
+                self._spread_percent = ((self.ask - self.bid) / mid_price) * 100
+
     @property
     def has_pre_market_data(self) -> bool:
         """Check if stock has pre-market data available"""
@@ -119,64 +177,60 @@ class StockData:
 
     @property
     def change_percent(self) -> Optional[float]:
-        """Calculate percentage change from previous close"""
-        if self.pre_market_price and self.previous_close:
-            return ((self.pre_market_price - self.previous_close) / self.previous_close) * 100
-        elif self.current_price and self.previous_close:
-            return ((self.current_price - self.previous_close) / self.previous_close) * 100
-        return None
+        """Percentage change of the display price from previous close"""
+        return self._change_percent
 
     @property
     def display_price(self) -> Optional[float]:
         """Get the most relevant price (pre-market if available, else current)"""
-        return self.pre_market_price or self.current_price
+        return self._display_price
 
     @property
     def relative_volume_ratio(self) -> Optional[float]:
         """
-        Calculate RVOL: Current volume / Average volume
+        RVOL: Current volume / Average volume
         >3.0 indicates strong conviction, <1.0 indicates weak interest
         """
-        if self.average_volume and self.average_volume > 0:
-            current_vol = self.pre_market_volume if self.pre_market_volume > 0 else self.regular_market_volume
-            if current_vol > 0:
-                return current_vol / self.average_volume
-        return None
+        return self._relative_volume_ratio
 
     @property
     def spread_percent(self) -> Optional[float]:
         """
-        Calculate bid-ask spread as percentage of mid-price
+        Bid-ask spread as percentage of mid-price
         <1% is good liquidity, >2% may indicate illiquid stock
         """
-        if self.bid and self.ask and self.bid > 0:
-            mid_price = (self.bid + self.ask) / 2
-            if mid_price > 0:
-                spread = self.ask - self.bid
-                return (spread / mid_price) * 100
-        return None
+        return self._spread_percent
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
+        # Read the precomputed values directly rather than through properties
+        change = self._change_percent
+        rvol = self._relative_volume_ratio
+        spread = self._spread_percent
         return {
             'symbol': self.symbol,
             'company_name': self.company_name,
-            'current_price': self.display_price,
+            'current_price': self._display_price,
             'previous_close': self.previous_close,
-            'change_percent': round(self.change_percent, 2) if self.change_percent else None,
+            'change_percent': round(change, 2) if change else None,
             'volume': self.pre_market_volume or self.regular_market_volume,
             'market_cap': self.market_cap,
-            'has_pre_market': self.has_pre_market_data,
+            'has_pre_market': self.pre_market_price is not None,
             # Phase 1: Volume Metrics
             'pre_market_volume': self.pre_market_volume,
             'average_volume': self.average_volume,
-            'relative_volume_ratio': round(self.relative_volume_ratio, 2) if self.relative_volume_ratio else None,
-            'spread_percent': round(self.spread_percent, 3) if self.spread_percent else None,
+            'relative_volume_ratio': round(rvol, 2) if rvol else None,
+            'spread_percent': round(spread, 3) if spread else None,
         }
 
 
+def quote_ttl() -> int:
+    """Cache TTL for quotes: fresh during pre-market, regular and after hours."""
+    return QUOTE_TTL_CLOSED if market_session() == 'closed' else QUOTE_TTL_TRADING
+
+
+@cached(ttl_seconds=quote_ttl, key_prefix='stock_info')
 @yfinance_limiter
-@cached(ttl_seconds=300, key_prefix='stock_info')
 def _fetch_ticker_info(symbol: str) -> Dict:
     """
     Fetch ticker info with rate limiting, caching, and monitoring.
@@ -193,54 +247,92 @@ def _fetch_ticker_info(symbol: str) -> Dict:
     Raises:
         Exception: If API call fails after monitoring
     """
-    start_time = time()
-
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        with yfinance_monitor.record():
+            return yf.Ticker(symbol).info
+    except Exception as e:
+        # HTTP errors carry the status code (429, 404, 500, etc.)
+        if getattr(getattr(e, 'response', None), 'status_code', None) == 429:
+            logger.warning(
+                f"Rate limited for {symbol}. Consider increasing cache TTL or "
+                f"reducing scan frequency."
+            )
+        raise
 
-        # Calculate latency
-        latency_ms = int((time() - start_time) * 1000)
 
-        # Record successful call
-        yfinance_monitor.record_call(
-            success=True,
-            response_code=200,
-            latency_ms=latency_ms
-        )
+@cached(ttl_seconds=quote_ttl, key_prefix='stock_quotes')
+def _fetch_quote_chunk(symbols: tuple) -> Dict[str, Dict]:
+    """
+    Fetch info dicts for up to QUOTE_CHUNK_SIZE symbols in one quote request.
 
-        return info
+    Caching and rate limiting apply per chunk: one cache entry and one
+    yfinance_limiter token (taken by fetch_quotes_batch) per request.
 
-    except requests.exceptions.HTTPError as e:
-        # HTTP errors (429, 404, 500, etc.)
-        response_code = e.response.status_code if hasattr(e, 'response') else None
-        latency_ms = int((time() - start_time) * 1000)
+    Args:
+        symbols: Sorted tuple of ticker symbols (the cache key)
 
-        yfinance_monitor.record_call(
-            success=False,
-            response_code=response_code,
-            latency_ms=latency_ms
-        )
+    Returns:
+        Dict mapping symbol to an info dict in the shape StockData reads
+    """
+    with yfinance_monitor.record():
+        quotes = fetch_quotes_batch(list(symbols))
+    return {symbol: _yahoo_quote_to_info(quote) for symbol, quote in quotes.items()}
+
+
+def _yahoo_quote_to_info(quote: Dict) -> Dict:
+    """Map a Yahoo v7 quote onto the yfinance info keys StockData reads."""
+    return {
+        'symbol': quote['symbol'],
+        'longName': quote.get('longName') or quote.get('shortName', ''),
+        'regularMarketPrice': quote.get('regularMarketPrice'),
+        'previousClose': quote.get('regularMarketPreviousClose'),
+        'preMarketPrice': quote.get('preMarketPrice'),
+        'preMarketChangePercent': quote.get('preMarketChangePercent'),
+        'regularMarketVolume': quote.get('regularMarketVolume') or 0,
+        'preMarketVolume': quote.get('preMarketVolume') or 0,
+        'marketCap': quote.get('marketCap'),
+        'averageVolume': quote.get('averageDailyVolume3Month'),
+        'bid': quote.get('bid'),
+        'ask': quote.get('ask'),
+    }
+
+
+def _quote_chunks(symbols: List[str]) -> List[tuple]:
+    """
+    Split symbols into QUOTE_CHUNK_SIZE tuples for _fetch_quote_chunk.
 
-        if response_code == 429:
-            logger.warning(
-                f"Rate limited for {symbol}. Consider increasing cache TTL or "
-                f"reducing scan frequency."
-            )
+    Chunks are cut from the sorted, de-duplicated symbols so the same
+    universe always maps to the same chunks (and cache entries) whatever
+    its input order.
+    """
+    unique = sorted(set(symbols))
+    return [
+        tuple(unique[i:i + QUOTE_CHUNK_SIZE])
+        for i in range(0, len(unique), QUOTE_CHUNK_SIZE)
+    ]
 
-        raise
 
-    except Exception as e:
-        # Other errors (network, timeout, etc.)
-        latency_ms = int((time() - start_time) * 1000)
+def warm_quote_cache(symbols: List[str]) -> None:
+    """
+    Refetch quotes for symbols into the cache, replacing any cached entries.
 
-        yfinance_monitor.record_call(
-            success=False,
-            response_code=None,
-            latency_ms=latency_ms
-        )
+    Run periodically by the warm_quote_cache management command.
 
-        raise
+    Args:
+        symbols: Ticker symbols to keep warm (e.g. a watchlist)
+    """
+    chunks = _quote_chunks(symbols)
+    if not chunks:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_FETCH_WORKERS)) as executor:
+        futures = [executor.submit(_fetch_quote_chunk.refresh, chunk) for chunk in chunks]
+
+    for chunk, future in zip(chunks, futures):
+        try:
+            future.result()
+        except Exception as e:
+            logger.warning(f"Quote warm-up failed for {chunk[0]}..{chunk[-1]}: {e}")
 
 
 def get_stock_data(symbols: List[str]) -> List[StockData]:
@@ -249,9 +341,14 @@ def get_stock_data(symbols: List[str]) -> List[StockData]:
 
     Phase 3: Now includes:
     - Rate limiting (5 calls/second) to prevent 429 errors
-    - Caching (5-minute TTL) to reduce redundant API calls
+    - Caching (30s TTL while trading, 5 minutes when closed)
     - API monitoring for health metrics
 
+    Symbols are fetched QUOTE_CHUNK_SIZE at a time from Yahoo's batch quote
+    endpoint, with chunks in flight concurrently. Symbols a chunk fails to
+    return fall back to a per-symbol ticker.info fetch. Results keep the
+    order of `symbols`.
+
     Args:
         symbols: List of stock ticker symbols
 
@@ -262,11 +359,28 @@ def get_stock_data(symbols: List[str]) -> List[StockData]:
         return []
 
     results = []
+    chunks = _quote_chunks(symbols)
+
+    with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_FETCH_WORKERS)) as executor:
+        chunk_futures = [executor.submit(_fetch_quote_chunk, chunk) for chunk in chunks]
+
+    infos = {}
+    for chunk, future in zip(chunks, chunk_futures):
+        try:
+            infos.update(future.result())
+        except Exception as e:
+            logger.warning(f"Batch quote failed for {chunk[0]}..{chunk[-1]}, fetching per symbol: {e}")
+
+    # Fetch anything the batches missed per symbol (rate limited, cached, monitored)
+    missing = [symbol for symbol in symbols if symbol not in infos]
+    futures = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(len(missing), MAX_FETCH_WORKERS)) as executor:
+            futures = {symbol: executor.submit(_fetch_ticker_info, symbol) for symbol in missing}
 
     for symbol in symbols:
         try:
-            # Fetch ticker info (rate limited, cached, monitored)
-            info = _fetch_ticker_info(symbol)
+            info = infos[symbol] if symbol in infos else futures[symbol].result()
 
             if info and 'symbol' in info:
                 stock_data = StockData(symbol, info)
@@ -285,6 +399,12 @@ def get_top_movers(symbols: List[str], limit: int = 10) -> List[StockData]:
     """
     Get stocks with biggest percentage moves (pre-market or regular)
 
+    During the regular session with FMP configured, the list is screened
+    with batched FMP quotes (one request per 100 symbols) and only the top
+    candidates are fetched from yfinance. Outside it, FMP quotes only carry
+    the last regular-session move, which would miss pre-market gaps, so
+    every symbol is fetched from yfinance.
+
     Args:
         symbols: List of stock ticker symbols to check
         limit: Maximum number of results to return
@@ -292,15 +412,49 @@ def get_top_movers(symbols: List[str], limit: int = 10) -> List[StockData]:
     Returns:
         List of StockData objects sorted by absolute % change (descending)
     """
-    stocks = get_stock_data(symbols)
+    use_fmp_screen = settings.FMP_API_KEY and market_session() == 'regular'
+    quotes = get_quotes_bulk(symbols) if use_fmp_screen else {}
+    if not quotes:
+        return _sort_by_change(get_stock_data(symbols), limit)
+
+    # Screen the whole list from batched quotes, then fetch full yfinance
+    # data (pre-market price, bid/ask) only for the top candidates
+    candidates = _sort_by_change(
+        [StockData(symbol, _quote_to_info(quote)) for symbol, quote in quotes.items()],
+        limit,
+    )
+    detailed = {s.symbol: s for s in get_stock_data([c.symbol for c in candidates])}
+
+    return _sort_by_change([detailed.get(c.symbol, c) for c in candidates])
+
+
+def _quote_to_info(quote: Dict) -> Dict:
+    """Map an FMP quote onto the yfinance info keys StockData reads."""
+    return {
+        'longName': quote.get('name', ''),
+        'regularMarketPrice': quote.get('price'),
+        'previousClose': quote.get('previousClose'),
+        'regularMarketVolume': quote.get('volume') or 0,
+        'averageVolume': quote.get('avgVolume'),
+        'marketCap': quote.get('marketCap'),
+    }
+
+
+def _sort_by_change(stocks: List[StockData], limit: Optional[int] = None) -> List[StockData]:
+    """
+    Drop stocks without a price change and sort biggest movers first.
 
-    # Filter out stocks without price changes
+    With a limit, only the top `limit` are selected (a heap, not a full sort).
+    """
     stocks_with_changes = [s for s in stocks if s.change_percent is not None]
+    if limit is None:
+        return sorted(stocks_with_changes, key=_abs_change, reverse=True)
+    return heapq.nlargest(limit, stocks_with_changes, key=_abs_change)
 
-    # Sort by absolute percentage change (biggest movers first)
-    stocks_with_changes.sort(key=lambda x: abs(x.change_percent), reverse=True)
 
-    return stocks_with_changes[:limit]
+def _abs_change(stock: StockData) -> float:
+    """Sort key: absolute percentage change."""
+    return abs(stock.change_percent)
 
 
 def get_pre_market_movers(symbols: List[str], min_percent: float = 3.0, limit: int = 20) -> List[StockData]:
@@ -325,10 +479,8 @@ def get_pre_market_movers(symbols: List[str], min_percent: float = 3.0, limit: i
         abs(s.change_percent) >= min_percent
     ]
 
-    # Sort by absolute percentage change (biggest movers first)
-    pre_market_stocks.sort(key=lambda x: abs(x.change_percent), reverse=True)
-
-    return pre_market_stocks[:limit]
+    # Biggest movers first (by absolute percentage change)
+    return heapq.nlargest(limit, pre_market_stocks, key=_abs_change)
 
 
 def format_price(price: Optional[float]) -> str:
@@ -346,16 +498,16 @@ def format_percent(percent: Optional[float]) -> str:
     return f"{sign}{percent:.2f}%"
 
 
+# (divisor, suffix) indexed by the volume's power of 1000, capped at billions
+_VOLUME_UNITS = ((1, ''), (1_000, 'K'), (1_000_000, 'M'), (1_000_000_000, 'B'))
+
+
 def format_volume(volume: Optional[int]) -> str:
     """Format volume with K/M/B suffixes"""
     if volume is None or volume == 0:
         return "N/A"
-
-    if volume >= 1_000_000_000:
-        return f"{volume / 1_000_000_000:.2f}B"
-    elif volume >= 1_000_000:
-        return f"{volume / 1_000_000:.2f}M"
-    elif volume >= 1_000:
-        return f"{volume / 1_000:.2f}K"
-    else:
+    if volume < 1_000:
         return str(volume)
+
+    divisor, suffix = _VOLUME_UNITS[min(int(math.log10(volume)) // 3, 3)]
+    return f"{volume / divisor:.2f}{suffix}"
@@ -7,6 +7,7 @@ detecting rate limiting issues.
 
 from django.test import TestCase
 from django.core.cache import cache
+import time
 import unittest
 
 from strategies.api_monitoring import (
@@ -96,6 +97,65 @@ class ApiCallMonitorTestCase(TestCase):
         # Average should be (100+150+200+250+300)/5 = 200
         self.assertEqual(stats['average_latency_ms'], 200.0)
 
+    def test_calls_buffered_until_flush(self):
+        """Test that calls are written to the cache in batches"""
+
+        monitor = ApiCallMonitor('batched_api', flush_every=3, flush_interval=60)
+        key = 'api_monitor:batched_api:calls'
+
+        monitor.record_call(success=True, response_code=200)
+        monitor.record_call(success=True, response_code=200)
+        self.assertIsNone(cache.get(key), "Calls below the batch size stay buffered")
+
+        monitor.record_call(success=False, response_code=429)
+        self.assertEqual(cache.get(key)['total'], 3)
+
+        # get_stats includes calls still sitting in the buffer
+        monitor.record_call(success=True, response_code=200)
+        self.assertEqual(monitor.get_stats()['total_calls'], 4)
+
+    def test_buffered_calls_flushed_after_interval(self):
+        """Test that an idle monitor flushes its buffer after flush_interval"""
+
+        monitor = ApiCallMonitor('idle_api', flush_every=100, flush_interval=0.05)
+        key = 'api_monitor:idle_api:calls'
+
+        monitor.record_call(success=False, response_code=429)
+        self.assertIsNone(cache.get(key), "Call stays buffered until the interval passes")
+
+        # No further calls: the timer alone must publish the buffered call
+        deadline = time.monotonic() + 2
+        while cache.get(key) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        stats = cache.get(key)
+        self.assertIsNotNone(stats)
+        self.assertEqual(stats['total'], 1)
+        self.assertEqual(stats['rate_limited'], 1)
+
+    def test_record_context_manager(self):
+        """Test that record() counts success, failure and 429 responses"""
+
+        class RateLimited(Exception):
+            response = type('Response', (), {'status_code': 429})()
+
+        with self.monitor.record():
+            pass
+
+        with self.assertRaises(ValueError):
+            with self.monitor.record():
+                raise ValueError('bad data')
+
+        with self.assertRaises(RateLimited):
+            with self.monitor.record():
+                raise RateLimited()
+
+        stats = self.monitor.get_stats()
+        self.assertEqual(stats['total_calls'], 3)
+        self.assertEqual(stats['successful_calls'], 1)
+        self.assertEqual(stats['failed_calls'], 2)
+        self.assertEqual(stats['rate_limited_calls'], 1)
+
 
 class RateLimitDetectionTestCase(TestCase):
     """Tests for rate limit threshold detection"""
@@ -4,7 +4,7 @@ Unit tests for cache_utils.py
 Tests the @cached decorator, stable key generation, and helper functions.
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core.cache import cache
 from time import sleep
 import unittest
@@ -90,6 +90,40 @@ class CachedDecoratorTestCase(TestCase):
         self.assertEqual(self.call_count, 2,
             "Cache should expire after TTL")
 
+    def test_callable_ttl(self):
+        """Test that a callable TTL is evaluated when the result is stored"""
+
+        ttl = [1]
+
+        @cached(ttl_seconds=lambda: ttl[0], key_prefix='test')
+        def expensive_operation(x):
+            self.call_count += 1
+            return x * 2
+
+        expensive_operation(5)
+        ttl[0] = 60
+        expensive_operation(6)
+
+        sleep(1.5)
+
+        # The first result expired after 1s, the second is kept for 60s
+        expensive_operation(5)
+        expensive_operation(6)
+        self.assertEqual(self.call_count, 3)
+
+    def test_refresh_replaces_cached_value(self):
+        """Test that refresh() recomputes and stores despite a fresh entry"""
+
+        @cached(ttl_seconds=60, key_prefix='test')
+        def expensive_operation(x):
+            self.call_count += 1
+            return x * self.call_count
+
+        self.assertEqual(expensive_operation(5), 5)
+        self.assertEqual(expensive_operation.refresh(5), 10)
+        self.assertEqual(expensive_operation(5), 10)
+        self.assertEqual(self.call_count, 2)
+
     def test_cache_with_kwargs(self):
         """Test that kwargs are included in cache key"""
 
@@ -115,6 +149,57 @@ class CachedDecoratorTestCase(TestCase):
         self.assertEqual(self.call_count, 2,
             "Same kwargs should be cache hit")
 
+    def test_none_result_is_cached(self):
+        """Test that a None result is a cache hit, not a repeated miss"""
+
+        @cached(ttl_seconds=60, key_prefix='test')
+        def failed_lookup(symbol):
+            self.call_count += 1
+            return None
+
+        self.assertIsNone(failed_lookup('BAD'))
+        self.assertIsNone(failed_lookup('BAD'))
+        self.assertEqual(self.call_count, 1,
+            "Cached None should not trigger recomputation")
+
+    def test_precomputed_cache_key(self):
+        """Test that a key from make_key() hits the same cache entry"""
+
+        @cached(ttl_seconds=60, key_prefix='test')
+        def scan(config):
+            self.call_count += 1
+            return len(config)
+
+        config = {'min_volume': 1000000, 'min_change': 5.0}
+        key = scan.make_key(config)
+
+        self.assertEqual(scan(config), 2)
+        self.assertEqual(scan(config, cache_key=key), 2)
+        self.assertEqual(self.call_count, 1,
+            "Precomputed key should match the generated key")
+
+    # The file cache's add() is check-then-set, not atomic, so the lock
+    # guarantee is exercised against a backend with an atomic add()
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    })
+    def test_concurrent_misses_compute_once(self):
+        """Test that concurrent misses on one key run the function once"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        @cached(ttl_seconds=60, key_prefix='test')
+        def slow_operation(x):
+            self.call_count += 1
+            sleep(0.3)
+            return x * 2
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(slow_operation, [5] * 4))
+
+        self.assertEqual(results, [10] * 4)
+        self.assertEqual(self.call_count, 1,
+            "Only one caller should recompute a missing key")
+
 
 class StableCacheKeyTestCase(TestCase):
     """Tests for stable cache key generation"""
@@ -1,5 +1,6 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.utils import timezone
 from django.http import JsonResponse
 from .models import PreMarketMover
@@ -10,8 +11,8 @@ from .stock_data import get_stock_data, get_top_movers, format_price, format_per
 from .finnhub_service import get_top_news_article
 from .market_context import get_market_context  # Wave 2 Feature 2.1
 from .vwap_service import calculate_vwap  # Wave 2 Feature 2.2
-import json
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -171,29 +172,26 @@ Respond in JSON format:
 
     if response.success:
         try:
-            # Log token usage
+            # Try to parse JSON response
+            data = orjson.loads(response.content)
+            mover.ai_analysis = data.get('analysis', response.content)
+            mover.sentiment = data.get('sentiment', '')
+        except orjson.JSONDecodeError:
+            # If not valid JSON, just save the content as analysis
+            mover.ai_analysis = response.content[:500]  # Limit length
+            logger.warning(f"Could not parse AI response as JSON for mover {mover.id}")
+        mover.status = 'researching'
+
+        # Log token usage and save the analysis in one transaction
+        with transaction.atomic():
             TokenUsageLog.objects.create(
                 endpoint='analyze',
                 model=response.token_usage.model,
                 prompt_tokens=response.token_usage.prompt_tokens,
                 completion_tokens=response.token_usage.completion_tokens,
-                total_tokens=response.token_usage.total_tokens,
                 cost_estimate=calculate_cost(response.token_usage)
             )
-
-            # Try to parse JSON response
-            data = json.loads(response.content)
-            mover.ai_analysis = data.get('analysis', response.content)
-            mover.sentiment = data.get('sentiment', '')
-            mover.status = 'researching'
-            mover.save()
-
-        except json.JSONDecodeError:
-            # If not valid JSON, just save the content as analysis
-            mover.ai_analysis = response.content[:500]  # Limit length
-            mover.status = 'researching'
             mover.save()
-            logger.warning(f"Could not parse AI response as JSON for mover {mover.id}")
 
     else:
         logger.error(f"Failed to get AI analysis for mover {mover.id}: {response.error_message}")
@@ -49,8 +49,8 @@ class VWAPData:
         }
 
 
-@yfinance_limiter
 @cached(ttl_seconds=120, key_prefix='vwap')  # Cache for 2 minutes
+@yfinance_limiter
 def calculate_vwap(symbol: str) -> Optional[VWAPData]:
     """
     Calculate VWAP for a stock using intraday data.